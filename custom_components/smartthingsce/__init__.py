@@ -1,15 +1,18 @@
 """SmartThings Community Edition Integration."""
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ACCESS_TOKEN
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -18,14 +21,25 @@ from .const import (
     ATTR_COMMAND,
     ATTR_DEVICE_ID,
     ATTR_SCENE_ID,
+    CAPABILITY_TO_DOMAIN,
     CONF_LOCATION_ID,
     CONF_WEBHOOK_ENABLED,
+    DEVICE_CAPABILITIES,
+    DEVICE_COMPONENTS_BY_ID,
+    DEVICE_STATUS,
     DOMAIN,
+    OPTIMISTIC_CONFIRM_DELAY_SECONDS,
     PLATFORMS,
+    REQUEST_REFRESH_COOLDOWN_SECONDS,
     SERVICE_EXECUTE_SCENE,
     SERVICE_REFRESH_DEVICES,
     SERVICE_SEND_COMMAND,
     UPDATE_INTERVAL_SECONDS,
+    WEBHOOK_FALLBACK_INTERVAL_SECONDS,
+    get_all_device_capabilities,
+    get_device_capabilities,
+    get_device_name,
+    index_device_status,
 )
 from .smartthings_api import SmartThingsAPI
 from .webhook import WebhookManager
@@ -50,41 +64,66 @@ class SmartThingsCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
+            # Data is plain JSON so it compares by value; skip listener
+            # callbacks when a poll returns exactly what we already have
+            always_update=False,
+            # Coalesce refresh requests from commands sent in quick succession
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN_SECONDS,
+                immediate=False,
+            ),
         )
         self.api = api
         self.location_id = location_id
         self.devices: Dict[str, Dict[str, Any]] = {}
         self.rooms: Dict[str, Dict[str, Any]] = {}
         self.scenes: Dict[str, Dict[str, Any]] = {}
+        # Main-component capability ID to the IDs of devices that have it
+        self.capability_index: Dict[str, List[str]] = {}
+        # Devices with any of these capabilities get entities, so their status
+        # is always fetched
+        self._capabilities_of_interest = frozenset(CAPABILITY_TO_DOMAIN)
+        self._unsub_confirm_refresh: Optional[Callable[[], None]] = None
+        # Set once SmartThings pushes device events to the webhook
+        self.push_enabled = False
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from SmartThings API."""
         try:
             _LOGGER.debug("Starting data fetch from SmartThings API")
 
-            # Fetch devices
-            devices = await self.api.get_devices(self.location_id)
+            # Devices, rooms and scenes are independent, fetch them concurrently
+            devices, rooms, scenes = await asyncio.gather(
+                self.api.get_devices(self.location_id),
+                self.api.get_rooms(self.location_id),
+                self.api.get_scenes(self.location_id),
+            )
             _LOGGER.debug("Fetched %d devices from API", len(devices))
+            known_devices = self.devices
             self.devices = {device["deviceId"]: device for device in devices}
-
-            # Debug: Log device information
-            for device in devices:
-                _LOGGER.debug("Raw device structure: %s", device)
-                device_name = device.get("label", device.get("name", "Unknown"))
-                device_id = device.get("deviceId", "Unknown")
-                # Components is a list, find the 'main' component
-                components = device.get("components", [])
-                main_component = next(
-                    (c for c in components if c.get("id") == "main"), None
-                )
-                if main_component:
-                    capabilities = main_component.get("capabilities", [])
-                else:
-                    capabilities = []
-                cap_ids = [
-                    cap.get("id") if isinstance(cap, dict) else cap
-                    for cap in capabilities
-                ]
+            capability_index: Dict[str, List[str]] = {}
+            for device_id, device in self.devices.items():
+                device[DEVICE_COMPONENTS_BY_ID] = {
+                    component.get("id"): component
+                    for component in device.get("components", [])
+                }
+                device[DEVICE_CAPABILITIES] = get_device_capabilities(device)
+                for capability in device[DEVICE_CAPABILITIES]:
+                    capability_index.setdefault(capability, []).append(device_id)
+            self.capability_index = capability_index
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                for device in devices:
+                    _LOGGER.debug("Raw device structure: %s", device)
+
+            # Log each device once when it first shows up, not on every refresh
+            for device_id, device in self.devices.items():
+                if device_id in known_devices:
+                    continue
+                device_name = get_device_name(device)
+                cap_ids = sorted(get_device_capabilities(device))
                 _LOGGER.info(
                     "Device discovered: %s (ID: %s) with capabilities: %s",
                     device_name,
@@ -92,29 +131,45 @@ class SmartThingsCoordinator(DataUpdateCoordinator):
                     cap_ids,
                 )
 
-            # Fetch rooms
-            _LOGGER.debug("Fetching rooms")
-            rooms = await self.api.get_rooms(self.location_id)
             self.rooms = {room["roomId"]: room for room in rooms}
             _LOGGER.debug("Fetched %d rooms", len(rooms))
 
-            # Fetch scenes
-            _LOGGER.debug("Fetching scenes")
-            scenes = await self.api.get_scenes(self.location_id)
             self.scenes = {scene["sceneId"]: scene for scene in scenes}
             _LOGGER.debug("Fetched %d scenes", len(scenes))
 
-            # Get device status for all devices
-            _LOGGER.debug("Fetching status for %d devices", len(self.devices))
-            for device_id in self.devices:
-                try:
-                    status = await self.api.get_device_status(device_id)
-                    self.devices[device_id]["status"] = status
-                    _LOGGER.debug("Device %s status: %s", device_id, status)
-                except Exception as err:
+            # Get device status concurrently, skipping devices no platform uses.
+            # Some platforms pick devices by name rather than capability, so
+            # the first fetch covers every device and later ones every device
+            # that got entities
+            if self.data is None:
+                device_ids = list(self.devices)
+            else:
+                registered_ids = self._registered_device_ids()
+                device_ids = [
+                    device_id
+                    for device_id, device in self.devices.items()
+                    if device_id in registered_ids
+                    or not self._capabilities_of_interest.isdisjoint(
+                        get_all_device_capabilities(device)
+                    )
+                ]
+            _LOGGER.debug(
+                "Fetching status for %d of %d devices",
+                len(device_ids),
+                len(self.devices),
+            )
+            results = await asyncio.gather(
+                *(self.api.get_device_status(device_id) for device_id in device_ids),
+                return_exceptions=True,
+            )
+            for device_id, status in zip(device_ids, results):
+                if isinstance(status, Exception):
                     _LOGGER.warning(
-                        "Failed to get status for device %s: %s", device_id, err
+                        "Failed to get status for device %s: %s", device_id, status
                     )
+                    continue
+                index_device_status(self.devices[device_id], status)
+                _LOGGER.debug("Device %s status: %s", device_id, status)
 
             _LOGGER.debug("Data fetch completed successfully")
             return {
@@ -127,6 +182,66 @@ class SmartThingsCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error in _async_update_data: %s", err, exc_info=True)
             raise UpdateFailed(f"Error communicating with SmartThings API: {err}")
 
+    @callback
+    def _registered_device_ids(self) -> Set[str]:
+        """Return the IDs of devices this entry added to the device registry."""
+        device_registry = dr.async_get(self.hass)
+        return {
+            identifier
+            for device_entry in dr.async_entries_for_config_entry(
+                device_registry, self.config_entry.entry_id
+            )
+            for domain, identifier in device_entry.identifiers
+            if domain == DOMAIN
+        }
+
+    @callback
+    def async_set_attribute_value(
+        self,
+        device_id: str,
+        component_id: str,
+        capability: str,
+        attribute: str,
+        value: Any,
+    ) -> None:
+        """Apply the expected result of a successful command without polling."""
+        device = self.devices.get(device_id)
+        if device is None:
+            return
+
+        status = device.setdefault(DEVICE_STATUS, {})
+        status.setdefault(component_id, {}).setdefault(capability, {}).setdefault(
+            attribute, {}
+        )["value"] = value
+        index_device_status(device, status)
+        # The cached status no longer matches its ETag
+        self.api.invalidate_device_status(device_id)
+        self.async_set_updated_data(self.data)
+
+        # Poll once the device has had time to act, in case it did not
+        if self._unsub_confirm_refresh is not None:
+            self._unsub_confirm_refresh()
+        self._unsub_confirm_refresh = async_call_later(
+            self.hass, OPTIMISTIC_CONFIRM_DELAY_SECONDS, self._async_confirm_refresh
+        )
+
+    async def async_refresh_after_command(self) -> None:
+        """Request a refresh after a command unless its result will be pushed."""
+        if not self.push_enabled:
+            await self.async_request_refresh()
+
+    async def _async_confirm_refresh(self, _now: datetime) -> None:
+        """Refresh after optimistic updates to reconcile with the cloud."""
+        self._unsub_confirm_refresh = None
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending confirmation refresh and shut down."""
+        if self._unsub_confirm_refresh is not None:
+            self._unsub_confirm_refresh()
+            self._unsub_confirm_refresh = None
+        await super().async_shutdown()
+
 
 async def async_setup(hass: HomeAssistant, config: Dict) -> bool:
     """Set up the SmartThings Community Edition component."""
@@ -158,9 +273,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
-    # Ensure domain is initialized in hass.data
-    hass.data.setdefault(DOMAIN, {})
-
     # Store coordinator and API
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
@@ -168,14 +280,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "webhook_manager": None,
     }
 
-    # Setup webhook if enabled
-    if webhook_enabled:
+    async def async_setup_webhook() -> None:
+        """Set up the webhook and relax polling once push is active."""
         webhook_manager = WebhookManager(hass, api, coordinator, entry)
         await webhook_manager.async_setup()
         hass.data[DOMAIN][entry.entry_id]["webhook_manager"] = webhook_manager
 
-    # Setup platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        # State is pushed by SmartThings, only poll occasionally to catch drift
+        if webhook_manager.push_enabled:
+            coordinator.push_enabled = True
+            coordinator.update_interval = timedelta(
+                seconds=WEBHOOK_FALLBACK_INTERVAL_SECONDS
+            )
+
+    # Setup platforms, alongside the webhook if enabled
+    if webhook_enabled:
+        await asyncio.gather(
+            async_setup_webhook(),
+            hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        )
+    else:
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Register services
     await async_setup_services(hass, coordinator, api)
@@ -14,14 +14,19 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
     CONCENTRATION_PARTS_PER_MILLION,
-    PERCENTAGE,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_BY_CAPABILITY,
+    DEVICE_STATUS,
+    DOMAIN,
+    get_device_info,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +40,17 @@ AIR_QUALITY_INDEX_MAP = {
     6: "Hazardous",
 }
 
+# Air Quality Health Concern level icons (keys are lowercased)
+HEALTH_CONCERN_ICONS = {
+    "good": "mdi:emoticon-happy",
+    "moderate": "mdi:emoticon-neutral",
+    "slightlyunhealthy": "mdi:emoticon-sad",
+    "unhealthyforsensitivegroups": "mdi:emoticon-sad",
+    "unhealthy": "mdi:emoticon-sad",
+    "veryunhealthy": "mdi:emoticon-sad",
+    "hazardous": "mdi:emoticon-dead",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -45,429 +61,196 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     api = hass.data[DOMAIN][config_entry.entry_id]["api"]
 
+    # AIR_QUALITY_SENSOR_CLASSES is defined after the sensor classes below
     entities = []
-    for device_id, device in coordinator.devices.items():
-        capability_ids = get_device_capabilities(device)
-
-        # Air Quality Detector
-        if "airQualityDetector" in capability_ids:
-            _LOGGER.info(
-                "Creating air quality index sensor for device %s",
-                device.get("label", device_id),
-            )
-            entities.append(SmartThingsAirQualityIndex(coordinator, api, device_id))
-
-        # Dust Sensor (PM2.5/PM10)
-        if "dustSensor" in capability_ids:
-            _LOGGER.info(
-                "Creating dust sensor for device %s", device.get("label", device_id)
-            )
-            entities.append(SmartThingsDustSensor(coordinator, api, device_id))
-
-        # TVOC Measurement (Total Volatile Organic Compounds)
-        if "tvocMeasurement" in capability_ids:
-            _LOGGER.info(
-                "Creating TVOC sensor for device %s", device.get("label", device_id)
-            )
-            entities.append(SmartThingsTVOCSensor(coordinator, api, device_id))
-
-        # Formaldehyde Measurement
-        if "formaldehydeMeasurement" in capability_ids:
-            _LOGGER.info(
-                "Creating formaldehyde sensor for device %s",
-                device.get("label", device_id),
-            )
-            entities.append(SmartThingsFormaldehydeSensor(coordinator, api, device_id))
-
-        # Air Quality Health Concern
-        if "airQualityHealthConcern" in capability_ids:
-            _LOGGER.info(
-                "Creating air quality health concern sensor for device %s",
-                device.get("label", device_id),
-            )
-            entities.append(
-                SmartThingsAirQualityHealthConcern(coordinator, api, device_id)
+    for capability, sensor_class in AIR_QUALITY_SENSOR_CLASSES.items():
+        for device_id in coordinator.capability_index.get(capability, ()):
+            _LOGGER.debug(
+                "Creating %s for device %s",
+                sensor_class.__name__,
+                get_device_name(coordinator.devices[device_id], device_id),
             )
+            entities.append(sensor_class(coordinator, api, device_id))
 
     async_add_entities(entities)
 
 
-class SmartThingsAirQualityIndex(CoordinatorEntity, SensorEntity):
-    """Representation of a SmartThings Air Quality Index sensor."""
+class SmartThingsAirQualitySensor(CoordinatorEntity, SensorEntity):
+    """Base class for SmartThings air quality sensors."""
 
+    __slots__ = ("_api", "_device_id", "_device", "_status")
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
-    _attr_device_class = SensorDeviceClass.AQI
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _unique_id_suffix: str
+    # Capability and attribute holding the value
+    _capability: str
+    _attribute: str
 
     def __init__(self, coordinator, api, device_id: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._api = api
         self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_air_quality_index"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Air Quality Monitor"),
-            sw_version=DEVICE_VERSION,
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{self._unique_id_suffix}"
+        self._update_cache()
+        self._attr_device_info = get_device_info(
+            device_id, self._device, "Air Quality Monitor"
         )
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Air Quality Index"
-
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "airQualityDetector" in component_status:
-                aqi = (
-                    component_status["airQualityDetector"]
-                    .get("airQuality", {})
-                    .get("value")
-                )
-                if aqi is not None:
-                    try:
-                        return int(aqi)
-                    except (ValueError, TypeError):
-                        pass
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cache()
+        super()._handle_coordinator_update()
+
+    def _update_cache(self) -> None:
+        """Extract the sensor value from the latest device status."""
+        self._device = self.coordinator.devices.get(self._device_id) or {}
+        self._status = self._device.get(DEVICE_STATUS)
+        data = self._device.get(DEVICE_BY_CAPABILITY, {}).get(self._capability, {})
+        self._attr_native_value = self._compute_native_value(data)
+        self._attr_extra_state_attributes = self._compute_extra_state_attributes(data)
+
+    def _compute_native_value(self, data: dict[str, Any]) -> Any:
+        """Compute the native value from the capability status."""
+        value = data.get(self._attribute, {}).get("value")
+        if value is not None:
+            try:
+                return float(value)
+            except (ValueError, TypeError):
+                pass
 
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        aqi_value = self.native_value
-        attributes = {}
-
-        if aqi_value is not None:
-            attributes["aqi_description"] = AIR_QUALITY_INDEX_MAP.get(
-                aqi_value, "Unknown"
-            )
-
-        return attributes
+    def _compute_extra_state_attributes(
+        self, data: dict[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        """Compute additional state attributes."""
+        return None
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        return self._status is not None
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:air-filter"
 
+class SmartThingsAirQualityIndex(SmartThingsAirQualitySensor):
+    """Representation of a SmartThings Air Quality Index sensor."""
 
-class SmartThingsDustSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a SmartThings Dust/Particulate Matter sensor."""
+    _attr_name = "Air Quality Index"
+    _attr_icon = "mdi:air-filter"
+    _attr_device_class = SensorDeviceClass.AQI
+    _unique_id_suffix = "air_quality_index"
+    _capability = "airQualityDetector"
+    _attribute = "airQuality"
+
+    def _compute_native_value(self, data: dict[str, Any]) -> Optional[int]:
+        """Compute the air quality index."""
+        aqi = data.get(self._attribute, {}).get("value")
+        if aqi is not None:
+            try:
+                return int(aqi)
+            except (ValueError, TypeError):
+                pass
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
-    _attr_device_class = SensorDeviceClass.PM25
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
+        return None
 
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_dust_sensor"
+    def _compute_extra_state_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Compute additional state attributes."""
+        if self._attr_native_value is None:
+            return {}
+        return {
+            "aqi_description": AIR_QUALITY_INDEX_MAP.get(
+                self._attr_native_value, "Unknown"
+            )
+        }
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Air Quality Monitor"),
-            sw_version=DEVICE_VERSION,
-        )
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Particulate Matter"
+class SmartThingsDustSensor(SmartThingsAirQualitySensor):
+    """Representation of a SmartThings Dust/Particulate Matter sensor."""
 
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "dustSensor" in component_status:
-                # Try PM2.5 first, then PM10, then generic dust level
-                dust_data = component_status["dustSensor"]
-
-                if "fineDustLevel" in dust_data:
-                    pm25 = dust_data["fineDustLevel"].get("value")
-                    if pm25 is not None:
-                        try:
-                            return float(pm25)
-                        except (ValueError, TypeError):
-                            pass
-
-                if "dustLevel" in dust_data:
-                    dust = dust_data["dustLevel"].get("value")
-                    if dust is not None:
-                        try:
-                            return float(dust)
-                        except (ValueError, TypeError):
-                            pass
+    _attr_name = "Particulate Matter"
+    _attr_icon = "mdi:blur"
+    _attr_device_class = SensorDeviceClass.PM25
+    _attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
+    _unique_id_suffix = "dust_sensor"
+    _capability = "dustSensor"
+    _attribute = "fineDustLevel"
+
+    def _compute_native_value(self, data: dict[str, Any]) -> Optional[float]:
+        """Compute the particulate level."""
+        # Try PM2.5 first, then generic dust level
+        for attribute in ("fineDustLevel", "dustLevel"):
+            level = data.get(attribute, {}).get("value")
+            if level is not None:
+                try:
+                    return float(level)
+                except (ValueError, TypeError):
+                    pass
 
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
+    def _compute_extra_state_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Compute additional state attributes."""
         attributes = {}
-
-        for component_id, component_status in status.items():
-            if "dustSensor" in component_status:
-                dust_data = component_status["dustSensor"]
-
-                # Add PM10 if available
-                if "dustLevel" in dust_data:
-                    pm10 = dust_data["dustLevel"].get("value")
-                    if pm10 is not None:
-                        attributes["pm10"] = pm10
-
-                # Add fine dust level (PM2.5) separately if we're showing PM10 as main
-                if "fineDustLevel" in dust_data:
-                    pm25 = dust_data["fineDustLevel"].get("value")
-                    if pm25 is not None and self.name != "PM2.5":
-                        attributes["pm25"] = pm25
-
-                break
-
+        pm25 = data.get("fineDustLevel", {}).get("value")
+        pm10 = data.get("dustLevel", {}).get("value")
+        if pm10 is not None:
+            attributes["pm10"] = pm10
+        if pm25 is not None:
+            attributes["pm25"] = pm25
         return attributes
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:blur"
-
 
-class SmartThingsTVOCSensor(CoordinatorEntity, SensorEntity):
+class SmartThingsTVOCSensor(SmartThingsAirQualitySensor):
     """Representation of a SmartThings TVOC sensor."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
+    _attr_name = "TVOC"
+    _attr_icon = "mdi:chemical-weapon"
     _attr_device_class = SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
+    _unique_id_suffix = "tvoc_sensor"
+    _capability = "tvocMeasurement"
+    _attribute = "tvocLevel"
 
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_tvoc_sensor"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Air Quality Monitor"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "TVOC"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "tvocMeasurement" in component_status:
-                tvoc = (
-                    component_status["tvocMeasurement"]
-                    .get("tvocLevel", {})
-                    .get("value")
-                )
-                if tvoc is not None:
-                    try:
-                        return float(tvoc)
-                    except (ValueError, TypeError):
-                        pass
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:chemical-weapon"
 
-
-class SmartThingsFormaldehydeSensor(CoordinatorEntity, SensorEntity):
+class SmartThingsFormaldehydeSensor(SmartThingsAirQualitySensor):
     """Representation of a SmartThings Formaldehyde sensor."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_name = "Formaldehyde"
+    _attr_icon = "mdi:molecule"
     _attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
-
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_formaldehyde_sensor"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Air Quality Monitor"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Formaldehyde"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "formaldehydeMeasurement" in component_status:
-                formaldehyde = (
-                    component_status["formaldehydeMeasurement"]
-                    .get("formaldehydeLevel", {})
-                    .get("value")
-                )
-                if formaldehyde is not None:
-                    try:
-                        return float(formaldehyde)
-                    except (ValueError, TypeError):
-                        pass
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:molecule"
+    _unique_id_suffix = "formaldehyde_sensor"
+    _capability = "formaldehydeMeasurement"
+    _attribute = "formaldehydeLevel"
 
 
-class SmartThingsAirQualityHealthConcern(CoordinatorEntity, SensorEntity):
+class SmartThingsAirQualityHealthConcern(SmartThingsAirQualitySensor):
     """Representation of a SmartThings Air Quality Health Concern sensor."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
-
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_air_quality_health_concern"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Air Quality Monitor"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Air Quality Health Concern"
-
-    @property
-    def native_value(self) -> Optional[str]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "airQualityHealthConcern" in component_status:
-                concern = (
-                    component_status["airQualityHealthConcern"]
-                    .get("airQualityHealthConcern", {})
-                    .get("value")
-                )
-                return concern
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        concern_level = self.native_value
-        if concern_level:
-            concern_lower = concern_level.lower()
-            if "good" in concern_lower:
-                return "mdi:emoticon-happy"
-            elif "moderate" in concern_lower:
-                return "mdi:emoticon-neutral"
-            elif "unhealthy" in concern_lower:
-                return "mdi:emoticon-sad"
-            elif "hazardous" in concern_lower:
-                return "mdi:emoticon-dead"
-
-        return "mdi:air-filter"
+    _attr_name = "Air Quality Health Concern"
+    # The health concern is a level name, not a measurement
+    _attr_state_class = None
+    _unique_id_suffix = "air_quality_health_concern"
+    _capability = "airQualityHealthConcern"
+    _attribute = "airQualityHealthConcern"
+
+    def _compute_native_value(self, data: dict[str, Any]) -> Optional[str]:
+        """Compute the health concern level and its icon."""
+        value = data.get(self._attribute, {}).get("value")
+        self._attr_icon = "mdi:air-filter"
+        if isinstance(value, str):
+            self._attr_icon = HEALTH_CONCERN_ICONS.get(value.lower(), "mdi:air-filter")
+        return value
+
+
+# Capability to sensor class mapping, in entity creation order. Kept right
+# after the classes it names and read by async_setup_entry above
+AIR_QUALITY_SENSOR_CLASSES = {
+    "airQualityDetector": SmartThingsAirQualityIndex,
+    "dustSensor": SmartThingsDustSensor,
+    "tvocMeasurement": SmartThingsTVOCSensor,
+    "formaldehydeMeasurement": SmartThingsFormaldehydeSensor,
+    "airQualityHealthConcern": SmartThingsAirQualityHealthConcern,
+}
@@ -1,7 +1,8 @@
 """Binary sensor platform for SmartThings Community Edition."""
 
 import logging
-from typing import Optional
+import sys
+from typing import NamedTuple, Optional
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -9,101 +10,111 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import ATTRIBUTION, DEVICE_BY_CAPABILITY, DOMAIN, get_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+
+class BinarySensorSpec(NamedTuple):
+    """Description of a binary sensor derived from a capability."""
+
+    name: str
+    attribute: str
+    device_class: Optional[BinarySensorDeviceClass]
+    on_state: str
+    icon: Optional[str]
+
+
 # Binary sensor capability mappings
 BINARY_SENSOR_TYPES = {
-    "contactSensor": {
-        "name": "Contact",
-        "attribute": "contact",
-        "device_class": BinarySensorDeviceClass.DOOR,
-        "on_state": "open",
-        "icon": "mdi:door",
-    },
-    "motionSensor": {
-        "name": "Motion",
-        "attribute": "motion",
-        "device_class": BinarySensorDeviceClass.MOTION,
-        "on_state": "active",
-        "icon": "mdi:motion-sensor",
-    },
-    "presenceSensor": {
-        "name": "Presence",
-        "attribute": "presence",
-        "device_class": BinarySensorDeviceClass.PRESENCE,
-        "on_state": "present",
-        "icon": "mdi:account",
-    },
-    "waterSensor": {
-        "name": "Water",
-        "attribute": "water",
-        "device_class": BinarySensorDeviceClass.MOISTURE,
-        "on_state": "wet",
-        "icon": "mdi:water",
-    },
-    "smokeDetector": {
-        "name": "Smoke",
-        "attribute": "smoke",
-        "device_class": BinarySensorDeviceClass.SMOKE,
-        "on_state": "detected",
-        "icon": "mdi:smoke-detector",
-    },
-    "carbonMonoxideDetector": {
-        "name": "Carbon Monoxide",
-        "attribute": "carbonMonoxide",
-        "device_class": BinarySensorDeviceClass.CO,
-        "on_state": "detected",
-        "icon": "mdi:smoke-detector-alert",
-    },
+    "contactSensor": BinarySensorSpec(
+        name="Contact",
+        attribute="contact",
+        device_class=BinarySensorDeviceClass.DOOR,
+        on_state="open",
+        icon="mdi:door",
+    ),
+    "motionSensor": BinarySensorSpec(
+        name="Motion",
+        attribute="motion",
+        device_class=BinarySensorDeviceClass.MOTION,
+        on_state="active",
+        icon="mdi:motion-sensor",
+    ),
+    "presenceSensor": BinarySensorSpec(
+        name="Presence",
+        attribute="presence",
+        device_class=BinarySensorDeviceClass.PRESENCE,
+        on_state="present",
+        icon="mdi:account",
+    ),
+    "waterSensor": BinarySensorSpec(
+        name="Water",
+        attribute="water",
+        device_class=BinarySensorDeviceClass.MOISTURE,
+        on_state="wet",
+        icon="mdi:water",
+    ),
+    "smokeDetector": BinarySensorSpec(
+        name="Smoke",
+        attribute="smoke",
+        device_class=BinarySensorDeviceClass.SMOKE,
+        on_state="detected",
+        icon="mdi:smoke-detector",
+    ),
+    "carbonMonoxideDetector": BinarySensorSpec(
+        name="Carbon Monoxide",
+        attribute="carbonMonoxide",
+        device_class=BinarySensorDeviceClass.CO,
+        on_state="detected",
+        icon="mdi:smoke-detector-alert",
+    ),
     # Appliance binary sensors
-    "washerOperatingState": {
-        "name": "Washer Running",
-        "attribute": "machineState",
-        "device_class": BinarySensorDeviceClass.RUNNING,
-        "on_state": "run",
-        "icon": "mdi:washing-machine",
-    },
-    "dryerOperatingState": {
-        "name": "Dryer Running",
-        "attribute": "machineState",
-        "device_class": BinarySensorDeviceClass.RUNNING,
-        "on_state": "run",
-        "icon": "mdi:tumble-dryer",
-    },
-    "ovenOperatingState": {
-        "name": "Oven Running",
-        "attribute": "machineState",
-        "device_class": BinarySensorDeviceClass.RUNNING,
-        "on_state": "run",
-        "icon": "mdi:stove",
-    },
-    "dishwasherOperatingState": {
-        "name": "Dishwasher Running",
-        "attribute": "machineState",
-        "device_class": BinarySensorDeviceClass.RUNNING,
-        "on_state": "run",
-        "icon": "mdi:dishwasher",
-    },
-    "custom.error": {
-        "name": "Error",
-        "attribute": "error",
-        "device_class": BinarySensorDeviceClass.PROBLEM,
-        "on_state": "detected",
-        "icon": "mdi:alert-circle",
-    },
-    "samsungce.kidsLock": {
-        "name": "Kids Lock",
-        "attribute": "lockState",
-        "device_class": BinarySensorDeviceClass.LOCK,
-        "on_state": "locked",
-        "icon": "mdi:lock-outline",
-    },
+    "washerOperatingState": BinarySensorSpec(
+        name="Washer Running",
+        attribute="machineState",
+        device_class=BinarySensorDeviceClass.RUNNING,
+        on_state="run",
+        icon="mdi:washing-machine",
+    ),
+    "dryerOperatingState": BinarySensorSpec(
+        name="Dryer Running",
+        attribute="machineState",
+        device_class=BinarySensorDeviceClass.RUNNING,
+        on_state="run",
+        icon="mdi:tumble-dryer",
+    ),
+    "ovenOperatingState": BinarySensorSpec(
+        name="Oven Running",
+        attribute="machineState",
+        device_class=BinarySensorDeviceClass.RUNNING,
+        on_state="run",
+        icon="mdi:stove",
+    ),
+    "dishwasherOperatingState": BinarySensorSpec(
+        name="Dishwasher Running",
+        attribute="machineState",
+        device_class=BinarySensorDeviceClass.RUNNING,
+        on_state="run",
+        icon="mdi:dishwasher",
+    ),
+    "custom.error": BinarySensorSpec(
+        name="Error",
+        attribute="error",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        on_state="detected",
+        icon="mdi:alert-circle",
+    ),
+    "samsungce.kidsLock": BinarySensorSpec(
+        name="Kids Lock",
+        attribute="lockState",
+        device_class=BinarySensorDeviceClass.LOCK,
+        on_state="locked",
+        icon="mdi:lock-outline",
+    ),
 }
 
 
@@ -115,23 +126,12 @@ async def async_setup_entry(
     """Set up SmartThings binary sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    entities = []
-
-    for device_id, device in coordinator.devices.items():
-        # Get capabilities from the main component
-        capability_ids = get_device_capabilities(device)
-
-        # Create binary sensor for each supported capability
-        for cap_id in capability_ids:
-            if cap_id in BINARY_SENSOR_TYPES:
-                entities.append(
-                    SmartThingsBinarySensor(
-                        coordinator,
-                        device_id,
-                        cap_id,
-                        BINARY_SENSOR_TYPES[cap_id],
-                    )
-                )
+    # Create binary sensor for each supported capability of the main component
+    entities = [
+        SmartThingsBinarySensor(coordinator, device_id, cap_id, sensor_config)
+        for cap_id, sensor_config in BINARY_SENSOR_TYPES.items()
+        for device_id in coordinator.capability_index.get(cap_id, ())
+    ]
 
     async_add_entities(entities)
 
@@ -139,6 +139,12 @@ async def async_setup_entry(
 class SmartThingsBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Representation of a SmartThings binary sensor."""
 
+    __slots__ = (
+        "_device_id",
+        "_capability",
+        "_attribute",
+        "_on_state",
+    )
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
 
@@ -147,59 +153,36 @@ class SmartThingsBinarySensor(CoordinatorEntity, BinarySensorEntity):
         coordinator,
         device_id: str,
         capability: str,
-        sensor_config: dict,
+        sensor_config: BinarySensorSpec,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._device_id = device_id
         self._capability = capability
-        self._attribute = sensor_config["attribute"]
-        self._on_state = sensor_config["on_state"]
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_{capability}"
-        self._attr_name = sensor_config["name"]
-        self._attr_device_class = sensor_config.get("device_class")
-        self._attr_icon = sensor_config.get("icon")
+        self._attribute = sensor_config.attribute
+        self._on_state = sensor_config.on_state
+        self._attr_unique_id = sys.intern(f"{DOMAIN}_{device_id}_{capability}")
+        self._attr_name = sensor_config.name
+        self._attr_device_class = sensor_config.device_class
+        self._attr_icon = sensor_config.icon
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        ocf = device.get("ocf", {})
-
-        device_info = {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": device.get("label", device.get("name", "Unknown")),
-            "manufacturer": device.get("manufacturerName", "SmartThings"),
-            "model": device.get("deviceTypeName", "Sensor"),
-            "sw_version": DEVICE_VERSION,
-        }
-
-        # Add OCF device information if available
-        if ocf:
-            if "firmwareVersion" in ocf:
-                device_info["sw_version"] = ocf["firmwareVersion"]
-            if "hwVersion" in ocf:
-                device_info["hw_version"] = ocf["hwVersion"]
-            if "modelNumber" in ocf:
-                device_info["model"] = ocf["modelNumber"]
-
-        return DeviceInfo(**device_info)
+        self._attr_device_info = get_device_info(
+            device_id, coordinator.devices.get(device_id, {}), "Sensor"
+        )
 
     @property
     def is_on(self) -> Optional[bool]:
         """Return true if the binary sensor is on."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        # Try to find the capability in any component, not just "main"
-        value = None
-        for component_id, component_data in device_status.items():
-            if self._capability in component_data:
-                capability_data = component_data.get(self._capability, {})
-                value = capability_data.get(self._attribute, {}).get("value")
-                if value is not None:
-                    break
+        device = self.coordinator.devices.get(self._device_id)
+        if device is None:
+            return None
+
+        # The capability may live in any component, not just "main"
+        capability_data = device.get(DEVICE_BY_CAPABILITY, {}).get(self._capability)
+        if capability_data is None:
+            return None
 
+        value = capability_data.get(self._attribute, {}).get("value")
         if value is not None:
             return value == self._on_state
 
@@ -208,5 +191,5 @@ class SmartThingsBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
@@ -2,21 +2,25 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 import logging
+import sys
 from typing import Any, Optional
 
-from homeassistant.components.button import (
-    ButtonDeviceClass,
-    ButtonEntity,
-)
+from homeassistant.components.button import ButtonDeviceClass, ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_BY_CAPABILITY,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_info,
+    get_device_name,
+)
+from .smartthings_api import SmartThingsAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,170 +38,148 @@ async def async_setup_entry(
     for device_id, device in coordinator.devices.items():
         capability_ids = get_device_capabilities(device)
 
-        # Check for button capabilities
-        if "button" in capability_ids:
-            # Get number of buttons from device status
-            device_status = device.get("status", {})
-            button_count = 1  # Default to 1 button
-
-            # Try to determine number of buttons
-            for component_id, component_status in device_status.items():
-                if "button" in component_status:
-                    # Some devices report numberOfButtons
-                    if "numberOfButtons" in component_status["button"]:
-                        button_count = component_status["button"][
-                            "numberOfButtons"
-                        ].get("value", 1)
-                    # Otherwise check supportedButtonValues
-                    elif "supportedButtonValues" in component_status["button"]:
-                        supported_values = component_status["button"][
-                            "supportedButtonValues"
-                        ].get("value", [])
-                        if supported_values:
-                            button_count = len(supported_values)
-                    break
-
-            # Create button entities for each button
-            for button_number in range(1, button_count + 1):
-                _LOGGER.info(
-                    "Creating button %d for device %s",
-                    button_number,
-                    device.get("label", device_id),
-                )
-                entities.append(
-                    SmartThingsButton(coordinator, api, device_id, button_number)
-                )
-
-        elif "holdableButton" in capability_ids:
-            # Holdable buttons - typically scene controllers
-            device_status = device.get("status", {})
-            button_count = 1
-
-            for component_id, component_status in device_status.items():
-                if "holdableButton" in component_status:
-                    if "numberOfButtons" in component_status["holdableButton"]:
-                        button_count = component_status["holdableButton"][
-                            "numberOfButtons"
-                        ].get("value", 1)
-                    elif "supportedButtonValues" in component_status["holdableButton"]:
-                        supported_values = component_status["holdableButton"][
-                            "supportedButtonValues"
-                        ].get("value", [])
-                        if supported_values:
-                            button_count = len(supported_values)
-                    break
+        # Devices with both capabilities only get plain button entities.
+        # BUTTON_CLASSES is defined after the button classes below
+        for cap_key, button_class in BUTTON_CLASSES:
+            if cap_key not in capability_ids:
+                continue
 
+            button_count = _get_button_count(device, cap_key)
             for button_number in range(1, button_count + 1):
                 _LOGGER.info(
-                    "Creating holdable button %d for device %s",
+                    "Creating %s %d for device %s",
+                    cap_key,
                     button_number,
-                    device.get("label", device_id),
+                    get_device_name(device, device_id),
                 )
                 entities.append(
-                    SmartThingsHoldableButton(
-                        coordinator, api, device_id, button_number
+                    button_class(
+                        coordinator, api, device_id, button_number, button_count
                     )
                 )
+            break
 
     async_add_entities(entities)
 
 
-class SmartThingsButton(CoordinatorEntity, ButtonEntity):
-    """Representation of a SmartThings button."""
+def _get_button_count(device: dict[str, Any], capability: str) -> int:
+    """Get the number of buttons a device reports for a button capability."""
+    button_data = device.get(DEVICE_BY_CAPABILITY, {}).get(capability)
+    if button_data is not None:
+        # Some devices report numberOfButtons
+        number_of_buttons = button_data.get("numberOfButtons")
+        if number_of_buttons is not None:
+            return number_of_buttons.get("value", 1)
+
+        # Otherwise check supportedButtonValues
+        supported_values = button_data.get("supportedButtonValues", {}).get("value")
+        if supported_values:
+            return len(supported_values)
+
+    return 1  # Default to 1 button
 
+
+def _button_extra_attrs(button_data: Optional[dict[str, Any]]) -> dict[str, Any]:
+    """Build the state attributes shared by both button kinds."""
+    if button_data is None:
+        return {}
+
+    last_button = button_data.get("button")
+    supported_values = button_data.get("supportedButtonValues")
+
+    # Last button pressed info
+    last_button_info = last_button.get("value", {}) if last_button is not None else None
+    if isinstance(last_button_info, dict):
+        attributes = {
+            "last_pressed_button": last_button_info.get("buttonNumber"),
+            "last_pressed_action": last_button_info.get("action"),
+        }
+    else:
+        attributes = {}
+
+    # Supported button values
+    if supported_values is not None:
+        attributes["supported_actions"] = supported_values.get("value", [])
+
+    return attributes
+
+
+class SmartThingsButtonEntity(CoordinatorEntity, ButtonEntity):
+    """Base class for SmartThings buttons."""
+
+    __slots__ = (
+        "_api",
+        "_device_id",
+        "_button_number",
+        "_button_count",
+    )
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
     _attr_device_class = ButtonDeviceClass.IDENTIFY
-
-    def __init__(self, coordinator, api, device_id: str, button_number: int) -> None:
+    # Capability reporting the button, and the name used for the device
+    _capability: str
+    _unique_id_suffix: str
+    _default_name: str
+
+    def __init__(
+        self,
+        coordinator,
+        api,
+        device_id: str,
+        button_number: int,
+        button_count: int,
+    ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
         self._api = api
         self._device_id = device_id
         self._button_number = button_number
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_button_{button_number}"
-        self._last_pressed = None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Button"),
-            sw_version=DEVICE_VERSION,
+        self._button_count = button_count
+        self._attr_unique_id = sys.intern(
+            f"{DOMAIN}_{device_id}_{self._unique_id_suffix}_{button_number}"
+        )
+        self._attr_device_info = get_device_info(
+            device_id, coordinator.devices.get(device_id, {}), self._default_name
         )
 
     @property
     def name(self) -> str:
         """Return the name of the button."""
         device = self.coordinator.devices.get(self._device_id, {})
-        device_name = device.get("label", device.get("name", "Button"))
+        device_name = get_device_name(device, self._default_name)
 
         # If only one button, use device name
-        if self._get_button_count() == 1:
+        if self._button_count == 1:
             return device_name
 
         return f"{device_name} Button {self._button_number}"
 
-    def _get_button_count(self) -> int:
-        """Get the total number of buttons on this device."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        for component_id, component_status in device_status.items():
-            if "button" in component_status:
-                if "numberOfButtons" in component_status["button"]:
-                    return component_status["button"]["numberOfButtons"].get("value", 1)
-                elif "supportedButtonValues" in component_status["button"]:
-                    supported_values = component_status["button"][
-                        "supportedButtonValues"
-                    ].get("value", [])
-                    return len(supported_values) if supported_values else 1
-
-        return 1
+    def _get_button_status(self) -> Optional[dict[str, Any]]:
+        """Return the button status from whichever component has it."""
+        device = self.coordinator.devices.get(self._device_id)
+        if device is None:
+            return None
+        return device.get(DEVICE_BY_CAPABILITY, {}).get(self._capability)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        attributes = {}
-
-        # Add button state information
-        for component_id, component_status in device_status.items():
-            if "button" in component_status:
-                button_data = component_status["button"]
-
-                # Add last button pressed info
-                if "button" in button_data:
-                    last_button_info = button_data["button"].get("value", {})
-                    if isinstance(last_button_info, dict):
-                        attributes["last_pressed_button"] = last_button_info.get(
-                            "buttonNumber"
-                        )
-                        attributes["last_pressed_action"] = last_button_info.get(
-                            "action"
-                        )
-
-                # Add supported button values
-                if "supportedButtonValues" in button_data:
-                    attributes["supported_actions"] = button_data[
-                        "supportedButtonValues"
-                    ].get("value", [])
-
-                break
-
-        return attributes
+        return _button_extra_attrs(self._get_button_status())
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
+
+
+class SmartThingsButton(SmartThingsButtonEntity):
+    """Representation of a SmartThings button."""
+
+    _attr_icon = "mdi:gesture-tap-button"
+    _capability = "button"
+    _unique_id_suffix = "button"
+    _default_name = "Button"
 
     async def async_press(self) -> None:
         """Press the button."""
@@ -210,9 +192,6 @@ class SmartThingsButton(CoordinatorEntity, ButtonEntity):
                 self._device_id,
             )
 
-            # Update last pressed time for state tracking
-            self._last_pressed = datetime.now()
-
             # Some buttons might support a "push" command
             await self._api.send_device_command(
                 self._device_id,
@@ -220,115 +199,22 @@ class SmartThingsButton(CoordinatorEntity, ButtonEntity):
                 "push",
                 [self._button_number],
             )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+        except SmartThingsAPIError as err:
             _LOGGER.debug(
                 "Button %s may not support remote press: %s", self._device_id, err
             )
+            return
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:gesture-tap-button"
+        await self.coordinator.async_request_refresh()
 
 
-class SmartThingsHoldableButton(CoordinatorEntity, ButtonEntity):
+class SmartThingsHoldableButton(SmartThingsButtonEntity):
     """Representation of a SmartThings holdable button (scene controller)."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
-    _attr_device_class = ButtonDeviceClass.IDENTIFY
-
-    def __init__(self, coordinator, api, device_id: str, button_number: int) -> None:
-        """Initialize the button."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._button_number = button_number
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_holdable_button_{button_number}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Scene Controller"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the button."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_name = device.get("label", device.get("name", "Scene Controller"))
-
-        # If only one button, use device name
-        if self._get_button_count() == 1:
-            return device_name
-
-        return f"{device_name} Button {self._button_number}"
-
-    def _get_button_count(self) -> int:
-        """Get the total number of buttons on this device."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        for component_id, component_status in device_status.items():
-            if "holdableButton" in component_status:
-                if "numberOfButtons" in component_status["holdableButton"]:
-                    return component_status["holdableButton"]["numberOfButtons"].get(
-                        "value", 1
-                    )
-                elif "supportedButtonValues" in component_status["holdableButton"]:
-                    supported_values = component_status["holdableButton"][
-                        "supportedButtonValues"
-                    ].get("value", [])
-                    return len(supported_values) if supported_values else 1
-
-        return 1
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        attributes = {}
-
-        # Add holdable button state information
-        for component_id, component_status in device_status.items():
-            if "holdableButton" in component_status:
-                button_data = component_status["holdableButton"]
-
-                # Add last button pressed info
-                if "button" in button_data:
-                    last_button_info = button_data["button"].get("value", {})
-                    if isinstance(last_button_info, dict):
-                        attributes["last_pressed_button"] = last_button_info.get(
-                            "buttonNumber"
-                        )
-                        attributes["last_pressed_action"] = last_button_info.get(
-                            "action"
-                        )
-
-                # Add supported button values
-                if "supportedButtonValues" in button_data:
-                    attributes["supported_actions"] = button_data[
-                        "supportedButtonValues"
-                    ].get("value", [])
-
-                break
-
-        return attributes
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+    _attr_icon = "mdi:gesture-tap-hold"
+    _capability = "holdableButton"
+    _unique_id_suffix = "holdable_button"
+    _default_name = "Scene Controller"
 
     async def async_press(self) -> None:
         """Press the button."""
@@ -346,15 +232,20 @@ class SmartThingsHoldableButton(CoordinatorEntity, ButtonEntity):
                 "push",
                 [self._button_number],
             )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+        except SmartThingsAPIError as err:
             _LOGGER.debug(
                 "Holdable button %s may not support remote press: %s",
                 self._device_id,
                 err,
             )
+            return
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:gesture-tap-hold"
+        await self.coordinator.async_request_refresh()
+
+
+# Button capabilities in order of preference, with their entity classes.
+# Kept right after the classes it names and read by async_setup_entry above
+BUTTON_CLASSES = (
+    ("button", SmartThingsButton),
+    ("holdableButton", SmartThingsHoldableButton),
+)
@@ -3,25 +3,46 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Callable, Coroutine, Optional
 
-from homeassistant.components.camera import (
-    Camera,
-    CameraEntityFeature,
-)
+import aiohttp
+from aiohttp.hdrs import USER_AGENT
+
+from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_BY_CAPABILITY,
+    DEVICE_CAPABILITY_COMPONENTS,
+    DOMAIN,
+    IMAGE_CACHE_TTL_SECONDS,
+    IMAGE_CAPTURE_POLL_INTERVAL_SECONDS,
+    IMAGE_CAPTURE_TIMEOUT_SECONDS,
+    IMAGE_CHUNK_SIZE,
+    IMAGE_FETCH_TIMEOUT_SECONDS,
+    IMAGE_MAX_SIZE_BYTES,
+    IMAGE_READ_TIMEOUT_SECONDS,
+    get_device_capabilities,
+    get_device_info,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Capabilities that make a device a camera
+CAMERA_CAPABILITIES = ("videoStream", "imageCapture", "videoCapture")
+
+# Requests in flight across all cameras, so concurrent callers share them
+_INFLIGHT_IMAGES: dict[str, asyncio.Task[Optional[bytes]]] = {}
+_INFLIGHT_CAPTURES: dict[str, asyncio.Task[Any]] = {}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -32,19 +53,38 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     api = hass.data[DOMAIN][config_entry.entry_id]["api"]
 
-    entities = []
-    for device_id, device in coordinator.devices.items():
-        capability_ids = get_device_capabilities(device)
+    # Devices with any camera capability, once each and in discovery order
+    device_ids = dict.fromkeys(
+        device_id
+        for capability in CAMERA_CAPABILITIES
+        for device_id in coordinator.capability_index.get(capability, ())
+    )
+    if not device_ids:
+        return
+
+    # Dedicated connection pool for still images, so snapshot bursts cannot use
+    # up the connections Home Assistant's shared session needs for API calls.
+    # Connections are kept alive between polls so TLS sessions are reused
+    image_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            force_close=False,
+            enable_cleanup_closed=True,
+        ),
+        headers={USER_AGENT: SERVER_SOFTWARE},
+    )
+    config_entry.async_on_unload(image_session.close)
 
-        # Check for camera capabilities
-        if any(
-            cap in capability_ids
-            for cap in ["videoStream", "imageCapture", "videoCapture"]
-        ):
-            _LOGGER.info(
-                "Creating camera for device %s", device.get("label", device_id)
-            )
-            entities.append(SmartThingsCamera(coordinator, api, device_id))
+    entities = []
+    for device_id in device_ids:
+        device = coordinator.devices[device_id]
+        _LOGGER.info(
+            "Creating camera for device %s", get_device_name(device, device_id)
+        )
+        entities.append(SmartThingsCamera(coordinator, api, device_id, image_session))
 
     async_add_entities(entities)
 
@@ -55,56 +95,74 @@ class SmartThingsCamera(CoordinatorEntity, Camera):
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
 
-    def __init__(self, coordinator, api, device_id: str) -> None:
+    def __init__(
+        self,
+        coordinator,
+        api,
+        device_id: str,
+        session: aiohttp.ClientSession,
+    ) -> None:
         """Initialize the camera."""
         super().__init__(coordinator)
         self._api = api
         self._device_id = device_id
         self._attr_unique_id = f"{DOMAIN}_{device_id}_camera"
-        self._session = None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Camera"),
-            sw_version=DEVICE_VERSION,
+        self._session = session
+        self._image_value: Any = None
+        self._image_ready = asyncio.Event()
+        # Last fetched still image as (url, bytes, expiry on the monotonic clock)
+        self._image_cache: Optional[tuple[str, bytes, float]] = None
+        self._image_cache_ttl = IMAGE_CACHE_TTL_SECONDS
+        self._update_cache()
+        self._attr_device_info = get_device_info(device_id, self._device, "Camera")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # The coordinator skips polls that return unchanged data, so the
+        # cached index is only rebuilt when the device status really changed
+        self._update_cache()
+        super()._handle_coordinator_update()
+
+    def _update_cache(self) -> None:
+        """Index the device capabilities and status by capability."""
+        self._device = device = self.coordinator.devices.get(self._device_id) or {}
+        self._status = device.get("status")
+        self._caps = get_device_capabilities(device)
+        self._attr_supported_features = (
+            CameraEntityFeature.STREAM
+            if "videoStream" in self._caps
+            else CameraEntityFeature(0)
+        )
+        # Capability status and reporting component, indexed by the coordinator
+        self._by_capability = device.get(DEVICE_BY_CAPABILITY) or {}
+        self._capability_components = device.get(DEVICE_CAPABILITY_COMPONENTS) or {}
+
+        # Wake up anyone waiting for a capture once a new image is reported
+        capability_status = self._by_capability.get("imageCapture")
+        image_value = (
+            capability_status.get("image", {}).get("value")
+            if capability_status
+            else None
         )
+        if image_value != self._image_value:
+            self._image_value = image_value
+            self._image_cache = None
+            self._image_ready.set()
 
     @property
     def name(self) -> str:
         """Return the name of the camera."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Camera"))
-
-    @property
-    def supported_features(self) -> CameraEntityFeature:
-        """Return supported features."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        capability_ids = get_device_capabilities(device)
-
-        features = CameraEntityFeature(0)
-
-        if "videoStream" in capability_ids:
-            features |= CameraEntityFeature.STREAM
-
-        return features
+        device = self._device
+        return get_device_name(device, "Camera")
 
     @property
     def is_on(self) -> bool:
         """Return true if camera is on."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
         # Check switch capability for power state
-        for component_id, component_status in status.items():
-            if "switch" in component_status:
-                switch_state = component_status["switch"].get("switch", {}).get("value")
-                return switch_state == "on"
+        capability_status = self._by_capability.get("switch")
+        if capability_status is not None:
+            return capability_status.get("switch", {}).get("value") == "on"
 
         # If no switch capability, assume camera is always on
         return True
@@ -112,66 +170,50 @@ class SmartThingsCamera(CoordinatorEntity, Camera):
     @property
     def is_streaming(self) -> bool:
         """Return true if camera is streaming."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "videoStream" in component_status:
-                stream_status = (
-                    component_status["videoStream"].get("stream", {}).get("value")
-                )
-                return stream_status == "active"
+        capability_status = self._by_capability.get("videoStream")
+        if capability_status is not None:
+            return capability_status.get("stream", {}).get("value") == "active"
 
         return False
 
     @property
     def motion_detection_enabled(self) -> bool:
         """Return the camera motion detection status."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "motionSensor" in component_status:
-                # If motion sensor capability exists, it's enabled
-                return True
-
-        return False
+        # If motion sensor capability exists, it's enabled
+        return "motionSensor" in self._by_capability
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
+        by_capability = self._by_capability
         attributes = {}
 
-        # Add camera-specific attributes
-        for component_id, component_status in status.items():
-            # Video stream attributes
-            if "videoStream" in component_status:
-                video_data = component_status["videoStream"]
-                for key, value_dict in video_data.items():
-                    if isinstance(value_dict, dict) and "value" in value_dict:
-                        attributes[f"video_{key}"] = value_dict["value"]
-
-            # Image capture attributes
-            if "imageCapture" in component_status:
-                image_data = component_status["imageCapture"]
-                for key, value_dict in image_data.items():
-                    if isinstance(value_dict, dict) and "value" in value_dict:
-                        attributes[f"image_{key}"] = value_dict["value"]
-
-            # Motion detection
-            if "motionSensor" in component_status:
-                motion = component_status["motionSensor"].get("motion", {}).get("value")
-                attributes["motion_detected"] = motion == "active"
+        # Video stream attributes
+        capability_status = by_capability.get("videoStream")
+        if capability_status is not None:
+            for key, value_dict in capability_status.items():
+                if isinstance(value_dict, dict) and "value" in value_dict:
+                    attributes[f"video_{key}"] = value_dict["value"]
+
+        # Image capture attributes
+        capability_status = by_capability.get("imageCapture")
+        if capability_status is not None:
+            for key, value_dict in capability_status.items():
+                if isinstance(value_dict, dict) and "value" in value_dict:
+                    attributes[f"image_{key}"] = value_dict["value"]
+
+        # Motion detection
+        capability_status = by_capability.get("motionSensor")
+        if capability_status is not None:
+            motion = capability_status.get("motion", {}).get("value")
+            attributes["motion_detected"] = motion == "active"
 
         return attributes
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        return self._status is not None
 
     async def async_camera_image(
         self, width: Optional[int] = None, height: Optional[int] = None
@@ -179,76 +221,38 @@ class SmartThingsCamera(CoordinatorEntity, Camera):
         """Return a still image response from the camera."""
         try:
             # Try to get image from imageCapture capability
-            device = self.coordinator.devices.get(self._device_id, {})
-            status = device.get("status", {})
-
-            image_url = None
-            for component_id, component_status in status.items():
-                if "imageCapture" in component_status:
-                    # Look for image URL or base64 data
-                    image_data = component_status["imageCapture"]
-
-                    if "image" in image_data:
-                        image_info = image_data["image"].get("value")
-                        if isinstance(image_info, dict):
-                            image_url = image_info.get("url")
-                        elif isinstance(image_info, str):
-                            # Might be a direct URL
-                            image_url = image_info
-
-                    # Alternative: encrypted image URL
-                    if not image_url and "encryptedImage" in image_data:
-                        encrypted_info = image_data["encryptedImage"].get("value", {})
-                        if isinstance(encrypted_info, dict):
-                            image_url = encrypted_info.get("url")
-
-                    break
-
+            image_url = self._get_image_url()
             if image_url:
-                if not self._session:
-                    self._session = async_get_clientsession(self.hass)
-
                 # Fetch the image
-                async with asyncio.timeout(10):
-                    async with self._session.get(image_url) as response:
-                        if response.status == 200:
-                            return await response.read()
-                        else:
-                            _LOGGER.warning(
-                                "Failed to fetch camera image: HTTP %d", response.status
-                            )
+                image = await self._async_fetch_image(image_url)
+                if image is not None:
+                    return image
 
             # Fallback: try to capture a new image
-            await self._api.send_device_command(
+            self._image_ready.clear()
+            await self._async_coalesce(
+                _INFLIGHT_CAPTURES,
                 self._device_id,
-                "imageCapture",
-                "take",
+                lambda: self._api.send_device_command(
+                    self._device_id,
+                    "imageCapture",
+                    "take",
+                ),
             )
 
-            # Wait a moment and try again
-            await asyncio.sleep(2)
-            await self.coordinator.async_request_refresh()
+            # Wait for the new image to show up in a poll or pushed event
+            if not await self._async_wait_for_image():
+                _LOGGER.debug(
+                    "No new image reported by device %s after capture",
+                    self._device_id,
+                )
 
             # Try to get the updated image URL
-            device = self.coordinator.devices.get(self._device_id, {})
-            status = device.get("status", {})
-
-            for component_id, component_status in status.items():
-                if "imageCapture" in component_status:
-                    image_data = component_status["imageCapture"]
-                    if "image" in image_data:
-                        image_info = image_data["image"].get("value")
-                        if isinstance(image_info, dict):
-                            image_url = image_info.get("url")
-                        elif isinstance(image_info, str):
-                            image_url = image_info
-
-                        if image_url and self._session:
-                            async with asyncio.timeout(10):
-                                async with self._session.get(image_url) as response:
-                                    if response.status == 200:
-                                        return await response.read()
-                    break
+            image_url = self._get_image_url()
+            if image_url:
+                image = await self._async_fetch_image(image_url)
+                if image is not None:
+                    return image
 
             _LOGGER.warning(
                 "Unable to retrieve camera image for device %s", self._device_id
@@ -261,30 +265,140 @@ class SmartThingsCamera(CoordinatorEntity, Camera):
             )
             return None
 
+    async def _async_wait_for_image(self) -> bool:
+        """Wait until a new image is reported, polling unless it is pushed."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + IMAGE_CAPTURE_TIMEOUT_SECONDS
+        await self.coordinator.async_request_refresh()
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            # Pushed events need no polling, otherwise poll again in a while
+            if not self.coordinator.push_enabled:
+                remaining = min(remaining, IMAGE_CAPTURE_POLL_INTERVAL_SECONDS)
+            try:
+                async with asyncio.timeout(remaining):
+                    await self._image_ready.wait()
+                return True
+            except TimeoutError:
+                if not self.coordinator.push_enabled:
+                    await self.coordinator.async_request_refresh()
+
+    def _get_image_url(self) -> Optional[str]:
+        """Return the latest image URL reported by the imageCapture capability."""
+        capability_status = self._by_capability.get("imageCapture")
+        if capability_status is None:
+            return None
+        return self._extract_image_url(capability_status)
+
+    @staticmethod
+    def _extract_image_url(image_data: dict[str, Any]) -> Optional[str]:
+        """Extract the image URL from imageCapture attributes."""
+        image_url = None
+
+        # Look for image URL or base64 data
+        image_info = image_data.get("image", {}).get("value")
+        if isinstance(image_info, dict):
+            image_url = image_info.get("url")
+        elif isinstance(image_info, str):
+            # Might be a direct URL
+            image_url = image_info
+
+        # Alternative: encrypted image URL
+        if not image_url:
+            encrypted_info = image_data.get("encryptedImage", {}).get("value")
+            if isinstance(encrypted_info, dict):
+                image_url = encrypted_info.get("url")
+
+        return image_url
+
+    async def _async_coalesce(
+        self,
+        inflight: dict[str, asyncio.Task[Any]],
+        key: str,
+        target: Callable[[], Coroutine[Any, Any, Any]],
+    ) -> Any:
+        """Run target once for all concurrent callers using the same key."""
+        task = inflight.get(key)
+        if task is None:
+            task = self.hass.async_create_task(target())
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _async_fetch_image(self, image_url: str) -> Optional[bytes]:
+        """Fetch a still image, sharing the download with concurrent callers."""
+        cached = self._image_cache
+        if (
+            cached is not None
+            and cached[0] == image_url
+            and time.monotonic() < cached[2]
+        ):
+            return cached[1]
+
+        image = await self._async_coalesce(
+            _INFLIGHT_IMAGES, image_url, lambda: self._async_download_image(image_url)
+        )
+        if image is not None:
+            self._image_cache = (
+                image_url,
+                image,
+                time.monotonic() + self._image_cache_ttl,
+            )
+        return image
+
+    async def _async_download_image(self, image_url: str) -> Optional[bytes]:
+        """Download a still image."""
+        async with asyncio.timeout(IMAGE_FETCH_TIMEOUT_SECONDS):
+            async with self._session.get(image_url) as response:
+                if response.status == 200:
+                    async with asyncio.timeout(IMAGE_READ_TIMEOUT_SECONDS):
+                        return await self._async_read_body(response)
+                _LOGGER.warning(
+                    "Failed to fetch camera image: HTTP %d", response.status
+                )
+                return None
+
+    @staticmethod
+    async def _async_read_body(response: aiohttp.ClientResponse) -> Optional[bytes]:
+        """Read a response body, refusing bodies above the image size limit."""
+        if (response.content_length or 0) > IMAGE_MAX_SIZE_BYTES:
+            _LOGGER.warning(
+                "Camera image of %d bytes exceeds the size limit",
+                response.content_length,
+            )
+            return None
+        # The advertised length is not trusted, so the limit is also enforced
+        # while reading
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(IMAGE_CHUNK_SIZE):
+            size += len(chunk)
+            if size > IMAGE_MAX_SIZE_BYTES:
+                _LOGGER.warning("Camera image exceeds the size limit")
+                return None
+            chunks.append(chunk)
+        return b"".join(chunks)
+
     async def stream_source(self) -> Optional[str]:
         """Return the source of the stream."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "videoStream" in component_status:
-                stream_data = component_status["videoStream"]
-
-                # Look for stream URL
-                if "stream" in stream_data:
-                    stream_info = stream_data["stream"].get("value")
-                    if isinstance(stream_info, dict):
-                        return stream_info.get("url")
-                    elif isinstance(stream_info, str) and stream_info.startswith(
-                        "http"
-                    ):
-                        return stream_info
-
-                # Alternative: URI field
-                if "uri" in stream_data:
-                    uri = stream_data["uri"].get("value")
-                    if uri:
-                        return uri
+        stream_data = self._by_capability.get("videoStream")
+        if stream_data is not None:
+            # Look for stream URL
+            if "stream" in stream_data:
+                stream_info = stream_data["stream"].get("value")
+                if isinstance(stream_info, dict):
+                    return stream_info.get("url")
+                elif isinstance(stream_info, str) and stream_info.startswith("http"):
+                    return stream_info
+
+            # Alternative: URI field
+            if "uri" in stream_data:
+                uri = stream_data["uri"].get("value")
+                if uri:
+                    return uri
 
         return None
 
@@ -297,7 +411,16 @@ class SmartThingsCamera(CoordinatorEntity, Camera):
                 "switch",
                 "on",
             )
-            await self.coordinator.async_request_refresh()
+            # Update the component that reports the switch, if any
+            component_id = self._capability_components.get("switch")
+            if component_id is not None:
+                self.coordinator.async_set_attribute_value(
+                    self._device_id,
+                    component_id,
+                    "switch",
+                    "switch",
+                    "on",
+                )
         except Exception as err:
             _LOGGER.error("Failed to turn on camera %s: %s", self._device_id, err)
 
@@ -310,7 +433,16 @@ class SmartThingsCamera(CoordinatorEntity, Camera):
                 "switch",
                 "off",
             )
-            await self.coordinator.async_request_refresh()
+            # Update the component that reports the switch, if any
+            component_id = self._capability_components.get("switch")
+            if component_id is not None:
+                self.coordinator.async_set_attribute_value(
+                    self._device_id,
+                    component_id,
+                    "switch",
+                    "switch",
+                    "off",
+                )
         except Exception as err:
             _LOGGER.error("Failed to turn off camera %s: %s", self._device_id, err)
 
@@ -323,7 +455,6 @@ class SmartThingsCamera(CoordinatorEntity, Camera):
                 "motionSensor",
                 "enable",
             )
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.debug(
                 "Motion detection control not supported for camera %s: %s",
@@ -340,7 +471,6 @@ class SmartThingsCamera(CoordinatorEntity, Camera):
                 "motionSensor",
                 "disable",
             )
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.debug(
                 "Motion detection control not supported for camera %s: %s",
@@ -10,12 +10,17 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_BY_CAPABILITY,
+    DEVICE_CAPABILITY_COMPONENTS,
+    DOMAIN,
+    get_device_info,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,23 +34,25 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     api = hass.data[DOMAIN][config_entry.entry_id]["api"]
 
-    entities = []
+    # Create climate entity for thermostatCoolingSetpoint capability
+    entities = [
+        SmartThingsThermostat(coordinator, api, device_id)
+        for device_id in coordinator.capability_index.get(
+            "thermostatCoolingSetpoint", ()
+        )
+    ]
 
-    for device_id, device in coordinator.devices.items():
-        # Get capabilities from the main component
-        capability_ids = get_device_capabilities(device)
+    async_add_entities(entities)
 
-        # Create climate entity for thermostatCoolingSetpoint capability
-        if "thermostatCoolingSetpoint" in capability_ids:
-            entities.append(
-                SmartThingsThermostat(
-                    coordinator,
-                    api,
-                    device_id,
-                )
-            )
 
-    async_add_entities(entities)
+def _range_float(range_value: dict[str, Any], key: str, default: float) -> float:
+    """Read a float from a setpoint range, falling back to a default."""
+    if key in range_value:
+        try:
+            return float(range_value[key])
+        except (ValueError, TypeError):
+            pass
+    return default
 
 
 class SmartThingsThermostat(CoordinatorEntity, ClimateEntity):
@@ -70,168 +77,87 @@ class SmartThingsThermostat(CoordinatorEntity, ClimateEntity):
         self._device_id = device_id
         self._attr_unique_id = f"{device_id}_thermostat"
         self._attr_name = "Temperature Control"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-        main_status = device_status.get("main", {})
-        ocf = device.get("ocf", {})
-
-        device_info = {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": device.get("label", device.get("name", "Unknown")),
-            "manufacturer": device.get("manufacturerName", "SmartThings"),
-            "model": device.get("deviceTypeName", "Climate"),
-            "sw_version": DEVICE_VERSION,
-        }
-
-        # Add OCF device information if available
-        if ocf:
-            if "firmwareVersion" in ocf:
-                device_info["sw_version"] = ocf["firmwareVersion"]
-            if "hwVersion" in ocf:
-                device_info["hw_version"] = ocf["hwVersion"]
-            if "modelNumber" in ocf:
-                device_info["model"] = ocf["modelNumber"]
-
-        # For Samsung appliances, prefer Micom firmware version and otnDUID model
-        software_version = main_status.get("samsungce.softwareVersion", {})
-        if software_version:
-            versions = software_version.get("versions", {}).get("value", [])
-            for ver in versions:
-                if (
-                    ver.get("description") == "Micom"
-                    and ver.get("swType") == "Firmware"
-                ):
-                    device_info["sw_version"] = ver.get("versionNumber")
-                    break
-
-        software_update = main_status.get("samsungce.softwareUpdate", {})
-        if software_update:
-            otn_duid = software_update.get("otnDUID", {}).get("value")
-            if otn_duid:
-                device_info["model"] = otn_duid
-
-        return DeviceInfo(**device_info)
+        self._update_cache()
+        self._attr_device_info = get_device_info(device_id, self._device, "Climate")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # The coordinator skips polls that return unchanged data, so the
+        # cached index is only rebuilt when the device status really changed
+        self._update_cache()
+        super()._handle_coordinator_update()
+
+    def _update_cache(self) -> None:
+        """Index the device status by capability."""
+        self._device = device = self.coordinator.devices.get(self._device_id) or {}
+        self._status = device.get("status")
+        # Capability status and reporting component, indexed by the coordinator
+        self._by_capability = device.get(DEVICE_BY_CAPABILITY) or {}
+        self._capability_components = device.get(DEVICE_CAPABILITY_COMPONENTS) or {}
+
+        # Setpoint limits, with defaults suitable for refrigerators
+        range_value = self._get_setpoint_range()
+        self._attr_min_temp = _range_float(range_value, "minimum", -30.0)
+        self._attr_max_temp = _range_float(range_value, "maximum", 10.0)
+        self._attr_target_temperature_step = _range_float(range_value, "step", 1.0)
+
+    def _get_setpoint_range(self) -> dict[str, Any]:
+        """Return the cooling setpoint range reported by the device."""
+        capability_status = self._by_capability.get("thermostatCoolingSetpoint")
+        if capability_status is None:
+            return {}
+        range_value = capability_status.get("coolingSetpointRange", {}).get("value", {})
+        return range_value if isinstance(range_value, dict) else {}
 
     @property
     def current_temperature(self) -> Optional[float]:
         """Return the current temperature."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        # Try to find temperature in any component
-        for component_id, component_data in device_status.items():
-            if "temperatureMeasurement" in component_data:
-                temp_data = component_data.get("temperatureMeasurement", {})
-                temp_value = temp_data.get("temperature", {}).get("value")
-                if temp_value is not None:
-                    try:
-                        return float(temp_value)
-                    except (ValueError, TypeError):
-                        pass
+        capability_status = self._by_capability.get("temperatureMeasurement")
+        if capability_status is not None:
+            temp_value = capability_status.get("temperature", {}).get("value")
+            if temp_value is not None:
+                try:
+                    return float(temp_value)
+                except (ValueError, TypeError):
+                    pass
 
         return None
 
     @property
     def target_temperature(self) -> Optional[float]:
         """Return the target temperature."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        # Try to find cooling setpoint in any component
-        for component_id, component_data in device_status.items():
-            if "thermostatCoolingSetpoint" in component_data:
-                setpoint_data = component_data.get("thermostatCoolingSetpoint", {})
-                setpoint_value = setpoint_data.get("coolingSetpoint", {}).get("value")
-                if setpoint_value is not None:
-                    try:
-                        return float(setpoint_value)
-                    except (ValueError, TypeError):
-                        pass
+        capability_status = self._by_capability.get("thermostatCoolingSetpoint")
+        if capability_status is not None:
+            setpoint_value = capability_status.get("coolingSetpoint", {}).get("value")
+            if setpoint_value is not None:
+                try:
+                    return float(setpoint_value)
+                except (ValueError, TypeError):
+                    pass
 
         return None
 
-    @property
-    def min_temp(self) -> float:
-        """Return the minimum temperature."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        # Try to find cooling setpoint range in any component
-        for component_id, component_data in device_status.items():
-            if "thermostatCoolingSetpoint" in component_data:
-                setpoint_data = component_data.get("thermostatCoolingSetpoint", {})
-                range_value = setpoint_data.get("coolingSetpointRange", {}).get(
-                    "value", {}
-                )
-                if isinstance(range_value, dict) and "minimum" in range_value:
-                    try:
-                        return float(range_value["minimum"])
-                    except (ValueError, TypeError):
-                        pass
-
-        return -30.0  # Default minimum for refrigerators
-
-    @property
-    def max_temp(self) -> float:
-        """Return the maximum temperature."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        # Try to find cooling setpoint range in any component
-        for component_id, component_data in device_status.items():
-            if "thermostatCoolingSetpoint" in component_data:
-                setpoint_data = component_data.get("thermostatCoolingSetpoint", {})
-                range_value = setpoint_data.get("coolingSetpointRange", {}).get(
-                    "value", {}
-                )
-                if isinstance(range_value, dict) and "maximum" in range_value:
-                    try:
-                        return float(range_value["maximum"])
-                    except (ValueError, TypeError):
-                        pass
-
-        return 10.0  # Default maximum for refrigerators
-
-    @property
-    def target_temperature_step(self) -> float:
-        """Return the supported step of target temperature."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
-
-        # Try to find cooling setpoint range in any component
-        for component_id, component_data in device_status.items():
-            if "thermostatCoolingSetpoint" in component_data:
-                setpoint_data = component_data.get("thermostatCoolingSetpoint", {})
-                range_value = setpoint_data.get("coolingSetpointRange", {}).get(
-                    "value", {}
-                )
-                if isinstance(range_value, dict) and "step" in range_value:
-                    try:
-                        return float(range_value["step"])
-                    except (ValueError, TypeError):
-                        pass
-
-        return 1.0  # Default step
-
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
 
-        device = self.coordinator.devices.get(self._device_id, {})
-        device_status = device.get("status", {})
+        step = self.target_temperature_step or 1.0
+        # Nothing to send if the setpoint would not change
+        current = self.target_temperature
+        if current is not None and abs(current - temperature) < step / 2:
+            return
+
+        # Snap to the device step, sending whole degrees as integers
+        value = round(temperature / step) * step
+        value = int(value) if float(step).is_integer() else round(value, 2)
 
         # Find which component has thermostatCoolingSetpoint
-        target_component = "main"
-        for component_id, component_data in device_status.items():
-            if "thermostatCoolingSetpoint" in component_data:
-                target_component = component_id
-                break
+        target_component = self._capability_components.get(
+            "thermostatCoolingSetpoint", "main"
+        )
 
         try:
             # Send command to set cooling setpoint
@@ -239,11 +165,17 @@ class SmartThingsThermostat(CoordinatorEntity, ClimateEntity):
                 self._device_id,
                 "thermostatCoolingSetpoint",
                 "setCoolingSetpoint",
-                [int(temperature)],
+                [value],
                 component=target_component,
             )
-            # Request a coordinator refresh to update the state
-            await self.coordinator.async_request_refresh()
+            # Show the new setpoint right away, the coordinator confirms later
+            self.coordinator.async_set_attribute_value(
+                self._device_id,
+                target_component,
+                "thermostatCoolingSetpoint",
+                "coolingSetpoint",
+                value,
+            )
         except Exception as err:
             _LOGGER.error(
                 "Failed to set temperature for device %s: %s", self._device_id, err
@@ -252,5 +184,4 @@ class SmartThingsThermostat(CoordinatorEntity, ClimateEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        return self._status is not None
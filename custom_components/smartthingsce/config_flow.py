@@ -1,8 +1,8 @@
 """Config flow for SmartThings Community Edition."""
 
 import logging
+import secrets
 from typing import Any, Dict, Optional
-import uuid
 
 import voluptuous as vol
 
@@ -17,8 +17,6 @@ from .const import (
     CONF_WEBHOOK_ENABLED,
     DOMAIN,
     ERROR_AUTH_FAILED,
-    ERROR_CANNOT_CONNECT,
-    ERROR_INVALID_TOKEN,
     ERROR_NO_LOCATIONS,
     ERROR_UNKNOWN,
 )
@@ -26,6 +24,18 @@ from .smartthings_api import SmartThingsAPI, SmartThingsAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Schemas for the steps whose fields do not depend on earlier input
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ACCESS_TOKEN): str,
+    }
+)
+WEBHOOK_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_WEBHOOK_ENABLED, default=True): bool,
+    }
+)
+
 
 class SmartThingsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for SmartThings Community Edition."""
@@ -36,6 +46,8 @@ class SmartThingsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._access_token: Optional[str] = None
         self._locations: list = []
+        self._location_names: Dict[str, str] = {}
+        self._location_schema: Optional[vol.Schema] = None
         self._location_id: Optional[str] = None
 
     async def async_step_user(
@@ -55,6 +67,7 @@ class SmartThingsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
                 _LOGGER.debug("Attempting to validate token and fetch locations")
                 self._locations = await api.get_locations()
+                self._location_schema = None
                 _LOGGER.debug("Successfully fetched %d locations", len(self._locations))
 
                 if not self._locations:
@@ -71,15 +84,9 @@ class SmartThingsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
                 errors["base"] = ERROR_UNKNOWN
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_ACCESS_TOKEN): str,
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=USER_SCHEMA,
             errors=errors,
             description_placeholders={
                 "token_url": "https://account.smartthings.com/tokens"
@@ -94,18 +101,21 @@ class SmartThingsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._location_id = user_input[CONF_LOCATION_ID]
             return await self.async_step_webhook()
 
-        # Create location selection schema
-        location_options = {loc["locationId"]: loc["name"] for loc in self._locations}
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_LOCATION_ID): vol.In(location_options),
+        # Create location selection schema once per set of fetched locations,
+        # keeping the names for later steps
+        if self._location_schema is None:
+            self._location_names = {
+                loc["locationId"]: loc["name"] for loc in self._locations
             }
-        )
+            self._location_schema = vol.Schema(
+                {
+                    vol.Required(CONF_LOCATION_ID): vol.In(self._location_names),
+                }
+            )
 
         return self.async_show_form(
             step_id="location",
-            data_schema=data_schema,
+            data_schema=self._location_schema,
         )
 
     async def async_step_webhook(
@@ -116,19 +126,12 @@ class SmartThingsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             webhook_enabled = user_input.get(CONF_WEBHOOK_ENABLED, False)
 
             # Generate unique tunnel subdomain
-            unique_id = str(uuid.uuid4())[:8]
-            integration_id = str(uuid.uuid4())[:8]
+            unique_id = secrets.token_hex(4)
+            integration_id = secrets.token_hex(4)
             tunnel_subdomain = f"{unique_id}-{integration_id}-stce"
 
             # Create the config entry
-            title = next(
-                (
-                    loc["name"]
-                    for loc in self._locations
-                    if loc["locationId"] == self._location_id
-                ),
-                "SmartThings",
-            )
+            title = self._location_names.get(self._location_id, "SmartThings")
 
             await self.async_set_unique_id(f"{DOMAIN}_{self._location_id}")
             self._abort_if_unique_id_configured()
@@ -143,24 +146,11 @@ class SmartThingsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-        data_schema = vol.Schema(
-            {
-                vol.Optional(CONF_WEBHOOK_ENABLED, default=True): bool,
-            }
-        )
-
         return self.async_show_form(
             step_id="webhook",
-            data_schema=data_schema,
+            data_schema=WEBHOOK_SCHEMA,
             description_placeholders={
-                "location_name": next(
-                    (
-                        loc["name"]
-                        for loc in self._locations
-                        if loc["locationId"] == self._location_id
-                    ),
-                    "Unknown",
-                )
+                "location_name": self._location_names.get(self._location_id, "Unknown")
             },
         )
 
@@ -1,5 +1,10 @@
 """Constants for the SmartThings Community Edition integration."""
 
+from types import MappingProxyType
+from typing import Any, Optional
+
+from homeassistant.helpers.entity import DeviceInfo
+
 # Component domain
 __version__ = "1.5.0"
 VERSION = __version__
@@ -26,7 +31,29 @@ API_ROOMS = f"{API_BASE_URL}/locations/{{location_id}}/rooms"
 
 # Update intervals
 UPDATE_INTERVAL_SECONDS = 30
+# Safety-net polling interval while webhook events keep state current
+WEBHOOK_FALLBACK_INTERVAL_SECONDS = 900
 WEBHOOK_TIMEOUT_SECONDS = 30
+# Delay before a requested refresh runs, so bursts of commands share one poll
+REQUEST_REFRESH_COOLDOWN_SECONDS = 0.5
+# Delay before polling to confirm state that was set optimistically
+OPTIMISTIC_CONFIRM_DELAY_SECONDS = 10
+# How long to wait for a camera to report an image after a capture command
+IMAGE_CAPTURE_TIMEOUT_SECONDS = 10
+# How often to poll for the captured image while no webhook pushes it
+IMAGE_CAPTURE_POLL_INTERVAL_SECONDS = 1.5
+# How long a fetched camera still image is served from memory
+IMAGE_CACHE_TTL_SECONDS = 5
+# Overall limit for downloading a camera still image, and for reading its body
+IMAGE_FETCH_TIMEOUT_SECONDS = 10
+IMAGE_READ_TIMEOUT_SECONDS = 5
+# Chunk size used when streaming a camera still image into memory
+IMAGE_CHUNK_SIZE = 65536
+# Largest camera still image that is accepted
+IMAGE_MAX_SIZE_BYTES = 10 * 1024 * 1024
+
+# Maximum number of concurrent requests against the SmartThings API
+MAX_CONCURRENT_REQUESTS = 32
 
 # Webhook configuration
 WEBHOOK_PATH = "/api/smartthingsce"
@@ -45,6 +72,13 @@ PLATFORMS = [
     "vacuum",
 ]
 
+# Keys the coordinator stores on each device dictionary
+DEVICE_STATUS = "status"
+DEVICE_BY_CAPABILITY = "_by_capability"
+DEVICE_CAPABILITIES = "_capabilities"
+DEVICE_CAPABILITY_COMPONENTS = "_capability_components"
+DEVICE_COMPONENTS_BY_ID = "_components_by_id"
+
 # Attribute mapping
 ATTR_DEVICE_ID = "device_id"
 ATTR_CAPABILITY = "capability"
@@ -70,188 +104,278 @@ ERROR_UNKNOWN = "unknown"
 ATTRIBUTION = "Data provided by SmartThings API"
 
 # SmartThings capability to Home Assistant domain mapping
-CAPABILITY_TO_DOMAIN = {
-    "switch": "switch",
-    "switchLevel": "light",
-    "colorControl": "light",
-    "colorTemperature": "light",
-    "thermostat": "climate",
-    "thermostatCoolingSetpoint": "climate",
-    "thermostatHeatingSetpoint": "climate",
-    "thermostatFanMode": "climate",
-    "thermostatMode": "thermostat",
-    "lock": "lock",
-    "doorControl": "cover",
-    "windowShade": "cover",
-    "garageDoorControl": "cover",
-    "fanSpeed": "fan",
-    # Media Player capabilities
-    "mediaPlayback": "media_player",
-    "audioVolume": "media_player",
-    "tvChannel": "media_player",
-    "mediaInputSource": "media_player",
-    "audioMute": "media_player",
-    # Siren capabilities
-    "alarm": "siren",
-    "tone": "siren",
-    "chime": "siren",
-    # Button capabilities
-    "button": "button",
-    "holdableButton": "button",
-    # Air Quality capabilities
-    "airQualityDetector": "sensor",
-    "dustSensor": "sensor",
-    "tvocMeasurement": "sensor",
-    "formaldehydeMeasurement": "sensor",
-    "airQualityHealthConcern": "sensor",
-    # Valve capabilities
-    "valve": "valve",
-    # Energy Monitor capabilities (enhanced)
-    "voltageMeasurement": "sensor",
-    "currentMeasurement": "sensor",
-    # Camera capabilities
-    "videoStream": "camera",
-    "imageCapture": "camera",
-    "videoCapture": "camera",
-    "contactSensor": "binary_sensor",
-    "motionSensor": "binary_sensor",
-    "presenceSensor": "binary_sensor",
-    "waterSensor": "binary_sensor",
-    "smokeDetector": "binary_sensor",
-    "carbonMonoxideDetector": "binary_sensor",
-    "temperatureMeasurement": "sensor",
-    "relativeHumidityMeasurement": "sensor",
-    "illuminanceMeasurement": "sensor",
-    "powerMeter": "sensor",
-    "energyMeter": "sensor",
-    "battery": "sensor",
-    "voltage": "sensor",
-    # Appliance capabilities
-    "refrigeration": "sensor",
-    "refrigerationSetpoint": "sensor",
-    "washerMode": "sensor",
-    "washerOperatingState": "sensor",
-    "dryerMode": "sensor",
-    "dryerOperatingState": "sensor",
-    "ovenMode": "sensor",
-    "ovenOperatingState": "sensor",
-    "ovenSetpoint": "sensor",
-    "dishwasherMode": "sensor",
-    "dishwasherOperatingState": "sensor",
-    "robotCleanerMovement": "vacuum",
-    "robotCleanerCleaningMode": "vacuum",
-    "robotCleanerTurboMode": "vacuum",
-    "samsungce.robotCleanerCleaningArea": "vacuum",
-    "custom.completionTime": "sensor",
-    "custom.runningTime": "sensor",
-    "custom.runningCourse": "sensor",
-    "custom.error": "sensor",
-    "samsungce.kidsLock": "binary_sensor",
-    "samsungce.powerCool": "switch",
-    "samsungce.powerFreeze": "switch",
-    # Pet Care capabilities
-    "petFeederOperatingState": "sensor",
-    "petFeederFoodLevel": "sensor",
-    "petFeederSchedule": "sensor",
-    "petFeederFeed": "switch",
-    # Plant Monitor capabilities
-    "soilMoisture": "sensor",
-    "plantMoisture": "sensor",
-    "plantHealth": "sensor",
-    "plantNutrient": "sensor",
-    # Solar Energy capabilities
-    "powerSource": "sensor",
-    "solarPanel": "sensor",
-    "solarPanelPower": "sensor",
-    "solarPanelEnergy": "sensor",
-    "inverter": "sensor",
-    "inverterStatus": "sensor",
-    "inverterEfficiency": "sensor",
-    "solarBatteryLevel": "sensor",
-    "solarEnergyProduction": "sensor",
-    # Pool/Spa Controller capabilities
-    "poolController": "sensor",
-    "poolHeater": "climate",
-    "poolPump": "switch",
-    "poolChlorine": "sensor",
-    "poolPH": "sensor",
-}
+CAPABILITY_TO_DOMAIN = MappingProxyType(
+    {
+        "switch": "switch",
+        "switchLevel": "light",
+        "colorControl": "light",
+        "colorTemperature": "light",
+        "thermostat": "climate",
+        "thermostatCoolingSetpoint": "climate",
+        "thermostatHeatingSetpoint": "climate",
+        "thermostatFanMode": "climate",
+        "thermostatMode": "thermostat",
+        "lock": "lock",
+        "doorControl": "cover",
+        "windowShade": "cover",
+        "garageDoorControl": "cover",
+        "fanSpeed": "fan",
+        # Media Player capabilities
+        "mediaPlayback": "media_player",
+        "audioVolume": "media_player",
+        "tvChannel": "media_player",
+        "mediaInputSource": "media_player",
+        "audioMute": "media_player",
+        # Siren capabilities
+        "alarm": "siren",
+        "tone": "siren",
+        "chime": "siren",
+        # Button capabilities
+        "button": "button",
+        "holdableButton": "button",
+        # Air Quality capabilities
+        "airQualityDetector": "sensor",
+        "dustSensor": "sensor",
+        "tvocMeasurement": "sensor",
+        "formaldehydeMeasurement": "sensor",
+        "airQualityHealthConcern": "sensor",
+        # Valve capabilities
+        "valve": "valve",
+        # Energy Monitor capabilities (enhanced)
+        "voltageMeasurement": "sensor",
+        "currentMeasurement": "sensor",
+        # Camera capabilities
+        "videoStream": "camera",
+        "imageCapture": "camera",
+        "videoCapture": "camera",
+        "contactSensor": "binary_sensor",
+        "motionSensor": "binary_sensor",
+        "presenceSensor": "binary_sensor",
+        "waterSensor": "binary_sensor",
+        "smokeDetector": "binary_sensor",
+        "carbonMonoxideDetector": "binary_sensor",
+        "temperatureMeasurement": "sensor",
+        "relativeHumidityMeasurement": "sensor",
+        "illuminanceMeasurement": "sensor",
+        "powerMeter": "sensor",
+        "energyMeter": "sensor",
+        "battery": "sensor",
+        "voltage": "sensor",
+        # Appliance capabilities
+        "refrigeration": "sensor",
+        "refrigerationSetpoint": "sensor",
+        "washerMode": "sensor",
+        "washerOperatingState": "sensor",
+        "dryerMode": "sensor",
+        "dryerOperatingState": "sensor",
+        "ovenMode": "sensor",
+        "ovenOperatingState": "sensor",
+        "ovenSetpoint": "sensor",
+        "dishwasherMode": "sensor",
+        "dishwasherOperatingState": "sensor",
+        "robotCleanerMovement": "vacuum",
+        "robotCleanerCleaningMode": "vacuum",
+        "robotCleanerTurboMode": "vacuum",
+        "samsungce.robotCleanerCleaningArea": "vacuum",
+        "custom.completionTime": "sensor",
+        "custom.runningTime": "sensor",
+        "custom.runningCourse": "sensor",
+        "custom.error": "sensor",
+        "samsungce.kidsLock": "binary_sensor",
+        "samsungce.powerCool": "switch",
+        "samsungce.powerFreeze": "switch",
+        # Pet Care capabilities
+        "petFeederOperatingState": "sensor",
+        "petFeederFoodLevel": "sensor",
+        "petFeederSchedule": "sensor",
+        "petFeederFeed": "switch",
+        # Plant Monitor capabilities
+        "soilMoisture": "sensor",
+        "plantMoisture": "sensor",
+        "plantHealth": "sensor",
+        "plantNutrient": "sensor",
+        # Solar Energy capabilities
+        "powerSource": "sensor",
+        "solarPanel": "sensor",
+        "solarPanelPower": "sensor",
+        "solarPanelEnergy": "sensor",
+        "inverter": "sensor",
+        "inverterStatus": "sensor",
+        "inverterEfficiency": "sensor",
+        "solarBatteryLevel": "sensor",
+        "solarEnergyProduction": "sensor",
+        # Pool/Spa Controller capabilities
+        "poolController": "sensor",
+        "poolHeater": "climate",
+        "poolPump": "switch",
+        "poolChlorine": "sensor",
+        "poolPH": "sensor",
+    }
+)
+
+
+def _invert_mapping(mapping) -> MappingProxyType:
+    """Group the keys of a mapping by value."""
+    inverted: dict = {}
+    for key, value in mapping.items():
+        inverted.setdefault(value, set()).add(key)
+    return MappingProxyType(
+        {value: frozenset(keys) for value, keys in inverted.items()}
+    )
+
+
+# Home Assistant domain to the SmartThings capabilities mapped to it
+DOMAIN_TO_CAPABILITIES = _invert_mapping(CAPABILITY_TO_DOMAIN)
 
 # Icon mapping for capabilities
-CAPABILITY_ICONS = {
-    "switch": "mdi:toggle-switch",
-    "switchLevel": "mdi:lightbulb",
-    "colorControl": "mdi:palette",
-    "colorTemperature": "mdi:thermometer",
-    "thermostat": "mdi:thermostat",
-    "lock": "mdi:lock",
-    "doorControl": "mdi:door",
-    "windowShade": "mdi:window-shutter",
-    "garageDoorControl": "mdi:garage",
-    "fanSpeed": "mdi:fan",
-    "contactSensor": "mdi:door",
-    "motionSensor": "mdi:motion-sensor",
-    "presenceSensor": "mdi:account",
-    "waterSensor": "mdi:water",
-    "smokeDetector": "mdi:smoke-detector",
-    "carbonMonoxideDetector": "mdi:smoke-detector-alert",
-    "temperatureMeasurement": "mdi:thermometer",
-    "relativeHumidityMeasurement": "mdi:water-percent",
-    "illuminanceMeasurement": "mdi:brightness-5",
-    "powerMeter": "mdi:flash",
-    "energyMeter": "mdi:lightning-bolt",
-    "battery": "mdi:battery",
-    "voltage": "mdi:sine-wave",
-    # Appliance icons
-    "refrigeration": "mdi:fridge",
-    "refrigerationSetpoint": "mdi:fridge-outline",
-    "washerMode": "mdi:washing-machine",
-    "washerOperatingState": "mdi:washing-machine",
-    "dryerMode": "mdi:tumble-dryer",
-    "dryerOperatingState": "mdi:tumble-dryer",
-    "ovenMode": "mdi:stove",
-    "ovenOperatingState": "mdi:stove",
-    "ovenSetpoint": "mdi:thermometer",
-    "dishwasherMode": "mdi:dishwasher",
-    "dishwasherOperatingState": "mdi:dishwasher",
-    "robotCleanerMovement": "mdi:robot-vacuum",
-    "robotCleanerCleaningMode": "mdi:robot-vacuum",
-    "robotCleanerTurboMode": "mdi:fast-forward",
-    "custom.completionTime": "mdi:clock-end",
-    "custom.runningTime": "mdi:timer",
-    "custom.runningCourse": "mdi:playlist-check",
-    "custom.error": "mdi:alert-circle",
-    "samsungce.kidsLock": "mdi:lock-outline",
-    # Pet Care icons
-    "petFeederOperatingState": "mdi:dog",
-    "petFeederFoodLevel": "mdi:bowl",
-    "petFeederSchedule": "mdi:clock-outline",
-    "petFeederFeed": "mdi:nutrition",
-    # Plant Monitor icons
-    "soilMoisture": "mdi:water-percent",
-    "plantMoisture": "mdi:leaf",
-    "plantHealth": "mdi:sprout",
-    "plantNutrient": "mdi:flask",
-    # Solar Energy icons
-    "powerSource": "mdi:power-plug",
-    "solarPanel": "mdi:solar-panel",
-    "solarPanelPower": "mdi:solar-power",
-    "solarPanelEnergy": "mdi:lightning-bolt",
-    "inverter": "mdi:power-cycle",
-    "inverterStatus": "mdi:check-circle",
-    "inverterEfficiency": "mdi:gauge",
-    "solarBatteryLevel": "mdi:battery-charging",
-    "solarEnergyProduction": "mdi:chart-line",
-    # Pool/Spa Controller icons
-    "poolController": "mdi:pool",
-    "poolHeater": "mdi:water-thermometer",
-    "poolPump": "mdi:pump",
-    "poolChlorine": "mdi:water",
-    "poolPH": "mdi:ph",
-}
-
-
-def get_device_capabilities(device: dict, component_id: str = "main") -> list:
+CAPABILITY_ICONS = MappingProxyType(
+    {
+        "switch": "mdi:toggle-switch",
+        "switchLevel": "mdi:lightbulb",
+        "colorControl": "mdi:palette",
+        "colorTemperature": "mdi:thermometer",
+        "thermostat": "mdi:thermostat",
+        "lock": "mdi:lock",
+        "doorControl": "mdi:door",
+        "windowShade": "mdi:window-shutter",
+        "garageDoorControl": "mdi:garage",
+        "fanSpeed": "mdi:fan",
+        "contactSensor": "mdi:door",
+        "motionSensor": "mdi:motion-sensor",
+        "presenceSensor": "mdi:account",
+        "waterSensor": "mdi:water",
+        "smokeDetector": "mdi:smoke-detector",
+        "carbonMonoxideDetector": "mdi:smoke-detector-alert",
+        "temperatureMeasurement": "mdi:thermometer",
+        "relativeHumidityMeasurement": "mdi:water-percent",
+        "illuminanceMeasurement": "mdi:brightness-5",
+        "powerMeter": "mdi:flash",
+        "energyMeter": "mdi:lightning-bolt",
+        "battery": "mdi:battery",
+        "voltage": "mdi:sine-wave",
+        # Appliance icons
+        "refrigeration": "mdi:fridge",
+        "refrigerationSetpoint": "mdi:fridge-outline",
+        "washerMode": "mdi:washing-machine",
+        "washerOperatingState": "mdi:washing-machine",
+        "dryerMode": "mdi:tumble-dryer",
+        "dryerOperatingState": "mdi:tumble-dryer",
+        "ovenMode": "mdi:stove",
+        "ovenOperatingState": "mdi:stove",
+        "ovenSetpoint": "mdi:thermometer",
+        "dishwasherMode": "mdi:dishwasher",
+        "dishwasherOperatingState": "mdi:dishwasher",
+        "robotCleanerMovement": "mdi:robot-vacuum",
+        "robotCleanerCleaningMode": "mdi:robot-vacuum",
+        "robotCleanerTurboMode": "mdi:fast-forward",
+        "custom.completionTime": "mdi:clock-end",
+        "custom.runningTime": "mdi:timer",
+        "custom.runningCourse": "mdi:playlist-check",
+        "custom.error": "mdi:alert-circle",
+        "samsungce.kidsLock": "mdi:lock-outline",
+        # Pet Care icons
+        "petFeederOperatingState": "mdi:dog",
+        "petFeederFoodLevel": "mdi:bowl",
+        "petFeederSchedule": "mdi:clock-outline",
+        "petFeederFeed": "mdi:nutrition",
+        # Plant Monitor icons
+        "soilMoisture": "mdi:water-percent",
+        "plantMoisture": "mdi:leaf",
+        "plantHealth": "mdi:sprout",
+        "plantNutrient": "mdi:flask",
+        # Solar Energy icons
+        "powerSource": "mdi:power-plug",
+        "solarPanel": "mdi:solar-panel",
+        "solarPanelPower": "mdi:solar-power",
+        "solarPanelEnergy": "mdi:lightning-bolt",
+        "inverter": "mdi:power-cycle",
+        "inverterStatus": "mdi:check-circle",
+        "inverterEfficiency": "mdi:gauge",
+        "solarBatteryLevel": "mdi:battery-charging",
+        "solarEnergyProduction": "mdi:chart-line",
+        # Pool/Spa Controller icons
+        "poolController": "mdi:pool",
+        "poolHeater": "mdi:water-thermometer",
+        "poolPump": "mdi:pump",
+        "poolChlorine": "mdi:water",
+        "poolPH": "mdi:ph",
+    }
+)
+
+
+def get_device_identifiers(device_id: str) -> frozenset:
+    """
+    Get the device registry identifiers for a SmartThings device.
+
+    Args:
+        device_id: The SmartThings device ID
+
+    Returns:
+        Frozenset of (domain, device ID) identifiers
+    """
+    return frozenset({(DOMAIN, device_id)})
+
+
+def get_device_name(device: dict, default: str = "Unknown") -> str:
+    """
+    Get the display name of a SmartThings device.
+
+    Args:
+        device: The device dictionary from SmartThings API
+        default: Name to use when the device has neither label nor name
+
+    Returns:
+        The device label, falling back to its name and then the default
+    """
+    return device.get("label") or device.get("name") or default
+
+
+def get_device_info(device_id: str, device: dict, default_model: str) -> DeviceInfo:
+    """
+    Get the device registry information for a SmartThings device.
+
+    Args:
+        device_id: The SmartThings device ID
+        device: The device dictionary from SmartThings API
+        default_model: Model to report when the device has no type name
+
+    Returns:
+        Device info for the device registry
+    """
+    device_info = DeviceInfo(
+        identifiers=get_device_identifiers(device_id),
+        name=get_device_name(device),
+        manufacturer=device.get("manufacturerName", "SmartThings"),
+        model=device.get("deviceTypeName", default_model),
+        sw_version=DEVICE_VERSION,
+    )
+
+    # Add OCF device information if available
+    ocf = device.get("ocf") or {}
+    if "firmwareVersion" in ocf:
+        device_info["sw_version"] = ocf["firmwareVersion"]
+    if "hwVersion" in ocf:
+        device_info["hw_version"] = ocf["hwVersion"]
+    if "modelNumber" in ocf:
+        device_info["model"] = ocf["modelNumber"]
+
+    # For Samsung appliances, prefer Micom firmware version and otnDUID model
+    main_status = (device.get(DEVICE_STATUS) or {}).get("main", {})
+    software_version = main_status.get("samsungce.softwareVersion", {})
+    for ver in software_version.get("versions", {}).get("value") or []:
+        if ver.get("description") == "Micom" and ver.get("swType") == "Firmware":
+            device_info["sw_version"] = ver.get("versionNumber")
+            break
+
+    software_update = main_status.get("samsungce.softwareUpdate", {})
+    otn_duid = software_update.get("otnDUID", {}).get("value")
+    if otn_duid:
+        device_info["model"] = otn_duid
+
+    return device_info
+
+
+def get_device_capabilities(device: dict, component_id: str = "main") -> frozenset:
     """
     Extract capabilities from a SmartThings device.
 
@@ -260,11 +384,109 @@ def get_device_capabilities(device: dict, component_id: str = "main") -> list:
         component_id: The component ID to get capabilities from (default: "main")
 
     Returns:
-        List of capability IDs
+        Frozen set of capability IDs
     """
+    # The coordinator stores the main component's set on each device it
+    # fetches, so every platform setup shares it
+    if component_id == "main":
+        capability_ids = device.get(DEVICE_CAPABILITIES)
+        if capability_ids is not None:
+            return capability_ids
+
     components = device.get("components", [])
-    component = next((c for c in components if c.get("id") == component_id), None)
+    components_by_id = device.get(DEVICE_COMPONENTS_BY_ID)
+    if components_by_id is not None:
+        component = components_by_id.get(component_id)
+    else:
+        component = next((c for c in components if c.get("id") == component_id), None)
+    capability_ids = frozenset()
     if component:
         capabilities = component.get("capabilities", [])
-        return [cap.get("id") if isinstance(cap, dict) else cap for cap in capabilities]
-    return []
+        capability_ids = frozenset(
+            cap.get("id") if isinstance(cap, dict) else cap for cap in capabilities
+        )
+    return capability_ids
+
+
+def get_all_device_capabilities(device: dict) -> set:
+    """
+    Extract capabilities from every component of a SmartThings device.
+
+    Args:
+        device: The device dictionary from SmartThings API
+
+    Returns:
+        Set of capability IDs across all components
+    """
+    return {
+        cap.get("id") if isinstance(cap, dict) else cap
+        for component in device.get("components", [])
+        for cap in component.get("capabilities", [])
+    }
+
+
+def index_device_status(device: dict, status: dict) -> None:
+    """
+    Store a SmartThings device status together with its capability indexes.
+
+    Args:
+        device: The device dictionary from SmartThings API
+        status: The device status dictionary, keyed by component ID
+
+    The device gets the status itself, a map from capability ID to its
+    attribute dictionary and a map from capability ID to the component that
+    reports it. When several components report the same capability the main
+    component wins, then the first one, matching get_capability_status.
+    """
+    by_capability: dict = {}
+    capability_components: dict = {}
+    component_ids = sorted(status, key=lambda component_id: component_id != "main")
+    for component_id in component_ids:
+        for capability, attributes in status[component_id].items():
+            if capability not in by_capability:
+                by_capability[capability] = attributes
+                capability_components[capability] = component_id
+    device[DEVICE_STATUS] = status
+    device[DEVICE_BY_CAPABILITY] = by_capability
+    device[DEVICE_CAPABILITY_COMPONENTS] = capability_components
+
+
+def get_capability_status(status: dict, capability: str) -> Optional[dict]:
+    """
+    Find the status of a capability, looking at the main component first.
+
+    Args:
+        status: The device status dictionary, keyed by component ID
+        capability: The capability ID to look for
+
+    Returns:
+        The capability's attribute dictionary, or None if no component has it
+    """
+    main_status = status.get("main")
+    if main_status is not None:
+        attributes = main_status.get(capability)
+        if attributes is not None:
+            return attributes
+    for component_status in status.values():
+        attributes = component_status.get(capability)
+        if attributes is not None:
+            return attributes
+    return None
+
+
+def get_status_value(status: dict, capability: str, attribute: str) -> Any:
+    """
+    Read an attribute value from a device status.
+
+    Args:
+        status: The device status dictionary, keyed by component ID
+        capability: The capability ID holding the attribute
+        attribute: The attribute name
+
+    Returns:
+        The attribute value, or None if it is not reported
+    """
+    attributes = get_capability_status(status, capability)
+    if attributes is None:
+        return None
+    return attributes.get(attribute, {}).get("value")
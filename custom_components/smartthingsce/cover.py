@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 from homeassistant.components.cover import (
     ATTR_POSITION,
@@ -12,16 +12,77 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_BY_CAPABILITY,
+    DOMAIN,
+    DOMAIN_TO_CAPABILITIES,
+    get_device_capabilities,
+    get_device_info,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class CoverSpec(NamedTuple):
+    """Description of a cover derived from a capability."""
+
+    capability: str
+    attribute: str
+    unique_id_suffix: str
+    name: str
+    device_class: CoverDeviceClass
+    icon: str
+    label: str
+    stop_command: Optional[str] = None
+    level_capability: Optional[str] = None
+
+
+# Cover capabilities in order of preference
+COVER_SPECS = (
+    CoverSpec(
+        capability="windowShade",
+        attribute="windowShade",
+        unique_id_suffix="window_shade",
+        name="Window Shade",
+        device_class=CoverDeviceClass.SHADE,
+        icon="mdi:window-shutter",
+        label="cover",
+        stop_command="pause",
+        level_capability="windowShadeLevel",
+    ),
+    CoverSpec(
+        capability="doorControl",
+        attribute="door",
+        unique_id_suffix="door_control",
+        name="Door Control",
+        device_class=CoverDeviceClass.DOOR,
+        icon="mdi:door",
+        label="door",
+    ),
+    CoverSpec(
+        capability="garageDoorControl",
+        attribute="door",
+        unique_id_suffix="garage_door",
+        name="Garage Door",
+        device_class=CoverDeviceClass.GARAGE,
+        icon="mdi:garage",
+        label="garage door",
+    ),
+)
+
+# Capabilities that make a device a cover
+COVER_CAPABILITIES = DOMAIN_TO_CAPABILITIES["cover"]
+
+# Cover positions reported for windowShade states without a shade level
+SHADE_STATE_POSITIONS = {"open": 100, "closed": 0, "partially open": 50}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -33,115 +94,117 @@ async def async_setup_entry(
 
     entities = []
     for device_id, device in coordinator.devices.items():
-        capability_ids = get_device_capabilities(device)
-
-        # Check for cover capabilities
-        if "windowShade" in capability_ids:
-            _LOGGER.info(
-                "Creating window shade cover for device %s",
-                device.get("label", device_id),
-            )
-            entities.append(SmartThingsWindowShadeCover(coordinator, api, device_id))
-        elif "doorControl" in capability_ids:
-            _LOGGER.info(
-                "Creating door control cover for device %s",
-                device.get("label", device_id),
-            )
-            entities.append(SmartThingsDoorControlCover(coordinator, api, device_id))
-        elif "garageDoorControl" in capability_ids:
-            _LOGGER.info(
-                "Creating garage door cover for device %s",
-                device.get("label", device_id),
-            )
-            entities.append(SmartThingsGarageDoorCover(coordinator, api, device_id))
+        # Skip devices without any cover capability before the dispatch
+        capability_ids = COVER_CAPABILITIES.intersection(
+            get_device_capabilities(device)
+        )
+        if not capability_ids:
+            continue
+
+        # The first match decides the cover type
+        for spec in COVER_SPECS:
+            if spec.capability in capability_ids:
+                _LOGGER.info(
+                    "Creating %s cover for device %s",
+                    spec.capability,
+                    get_device_name(device, device_id),
+                )
+                entities.append(SmartThingsCover(coordinator, api, device_id, spec))
+                break
 
     async_add_entities(entities)
 
 
-class SmartThingsWindowShadeCover(CoordinatorEntity, CoverEntity):
-    """Representation of a SmartThings window shade."""
+class SmartThingsCover(CoordinatorEntity, CoverEntity):
+    """Representation of a SmartThings window shade, door or garage door."""
 
+    __slots__ = (
+        "_api",
+        "_device_id",
+        "_spec",
+        "_device",
+        "_status",
+        "_level",
+        "_state",
+        "_has_state",
+    )
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
-    _attr_device_class = CoverDeviceClass.SHADE
 
-    def __init__(self, coordinator, api, device_id: str) -> None:
+    def __init__(self, coordinator, api, device_id: str, spec: CoverSpec) -> None:
         """Initialize the cover."""
         super().__init__(coordinator)
         self._api = api
         self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_window_shade"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Window Shade"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the cover."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Window Shade"))
-
-    @property
-    def supported_features(self) -> CoverEntityFeature:
-        """Flag supported features."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        capability_ids = get_device_capabilities(device)
+        self._spec = spec
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{spec.unique_id_suffix}"
+        self._attr_device_class = spec.device_class
+        self._attr_icon = spec.icon
+        self._update_cache()
+        self._attr_device_info = get_device_info(device_id, self._device, spec.name)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cache()
+        super()._handle_coordinator_update()
+
+    def _update_cache(self) -> None:
+        """Derive the supported features and cover state from the device."""
+        spec = self._spec
+        self._device = device = self.coordinator.devices.get(self._device_id) or {}
+        self._status = device.get("status")
 
         features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
 
-        if "windowShadeLevel" in capability_ids:
+        level_capability = spec.level_capability
+        if level_capability and level_capability in get_device_capabilities(device):
             features |= CoverEntityFeature.SET_POSITION
 
+        # Read the level and state from the coordinator's capability index
+        by_capability = device.get(DEVICE_BY_CAPABILITY) or {}
+        self._level: Optional[int] = None
+        if level_capability:
+            level = by_capability.get(level_capability, {}).get("shadeLevel", {})
+            if level.get("value") is not None:
+                # Tolerate fractional or malformed levels from the device
+                try:
+                    self._level = int(float(level["value"]))
+                except (ValueError, TypeError):
+                    _LOGGER.debug(
+                        "Invalid shade level %s for device %s",
+                        level["value"],
+                        self._device_id,
+                    )
+        attributes = by_capability.get(spec.capability)
+        self._has_state = attributes is not None
+        self._state: Optional[str] = (
+            attributes.get(spec.attribute, {}).get("value") if attributes else None
+        )
+
         # Check if device supports stop
-        status = device.get("status", {})
-        for component_id, component_status in status.items():
-            if "windowShade" in component_status:
-                # If we have pause capability or stop is mentioned
-                features |= CoverEntityFeature.STOP
-                break
+        if spec.stop_command and self._has_state:
+            # If we have pause capability or stop is mentioned
+            features |= CoverEntityFeature.STOP
 
-        return features
+        self._attr_supported_features = features
+
+    @property
+    def name(self) -> str:
+        """Return the name of the cover."""
+        device = self._device
+        return get_device_name(device, self._spec.name)
 
     @property
     def current_cover_position(self) -> Optional[int]:
         """Return current position of cover."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        # Check for windowShadeLevel first (more precise)
-        for component_id, component_status in status.items():
-            if "windowShadeLevel" in component_status:
-                level = (
-                    component_status["windowShadeLevel"]
-                    .get("shadeLevel", {})
-                    .get("value")
-                )
-                if level is not None:
-                    return int(level)
-
-        # Fall back to windowShade state
-        for component_id, component_status in status.items():
-            if "windowShade" in component_status:
-                window_shade = (
-                    component_status["windowShade"].get("windowShade", {}).get("value")
-                )
-                if window_shade == "open":
-                    return 100
-                elif window_shade == "closed":
-                    return 0
-                elif window_shade == "partially open":
-                    return 50
-
-        return None
+        # Only window shades report a position
+        if not self._spec.level_capability:
+            return None
+        # Prefer the shade level (more precise), fall back to the shade state
+        if self._level is not None:
+            return self._level
+        return SHADE_STATE_POSITIONS.get(self._state)
 
     @property
     def is_closed(self) -> Optional[bool]:
@@ -149,253 +212,78 @@ class SmartThingsWindowShadeCover(CoordinatorEntity, CoverEntity):
         position = self.current_cover_position
         if position is not None:
             return position == 0
-
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "windowShade" in component_status:
-                window_shade = (
-                    component_status["windowShade"].get("windowShade", {}).get("value")
-                )
-                return window_shade == "closed"
-
+        if self._has_state:
+            return self._state == "closed"
         return None
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        return self._status is not None
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
         try:
             await self._api.send_device_command(
                 self._device_id,
-                "windowShade",
+                self._spec.capability,
                 "open",
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
-            _LOGGER.error("Failed to open cover %s: %s", self._device_id, err)
+            _LOGGER.error(
+                "Failed to open %s %s: %s", self._spec.label, self._device_id, err
+            )
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
         try:
             await self._api.send_device_command(
                 self._device_id,
-                "windowShade",
+                self._spec.capability,
                 "close",
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
-            _LOGGER.error("Failed to close cover %s: %s", self._device_id, err)
+            _LOGGER.error(
+                "Failed to close %s %s: %s", self._spec.label, self._device_id, err
+            )
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
+        if not self._spec.stop_command:
+            return
+
         try:
             await self._api.send_device_command(
                 self._device_id,
-                "windowShade",
-                "pause",
+                self._spec.capability,
+                self._spec.stop_command,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
-            _LOGGER.error("Failed to stop cover %s: %s", self._device_id, err)
+            _LOGGER.error(
+                "Failed to stop %s %s: %s", self._spec.label, self._device_id, err
+            )
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Move the cover to a specific position."""
         position = kwargs.get(ATTR_POSITION)
-        if position is None:
+        if position is None or not self._spec.level_capability:
             return
 
         try:
             await self._api.send_device_command(
                 self._device_id,
-                "windowShadeLevel",
+                self._spec.level_capability,
                 "setShadeLevel",
                 [position],
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
-            _LOGGER.error("Failed to set cover position %s: %s", self._device_id, err)
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:window-shutter"
-
-
-class SmartThingsDoorControlCover(CoordinatorEntity, CoverEntity):
-    """Representation of a SmartThings door control."""
-
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
-    _attr_device_class = CoverDeviceClass.DOOR
-
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the cover."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_door_control"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Door Control"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the cover."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Door Control"))
-
-    @property
-    def supported_features(self) -> CoverEntityFeature:
-        """Flag supported features."""
-        return CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
-
-    @property
-    def is_closed(self) -> Optional[bool]:
-        """Return if the cover is closed."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "doorControl" in component_status:
-                door = component_status["doorControl"].get("door", {}).get("value")
-                return door == "closed"
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    async def async_open_cover(self, **kwargs: Any) -> None:
-        """Open the cover."""
-        try:
-            await self._api.send_device_command(
-                self._device_id,
-                "doorControl",
-                "open",
-            )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to open door %s: %s", self._device_id, err)
-
-    async def async_close_cover(self, **kwargs: Any) -> None:
-        """Close the cover."""
-        try:
-            await self._api.send_device_command(
+            _LOGGER.error(
+                "Failed to set %s position %s: %s",
+                self._spec.label,
                 self._device_id,
-                "doorControl",
-                "close",
+                err,
             )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to close door %s: %s", self._device_id, err)
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:door"
-
-
-class SmartThingsGarageDoorCover(CoordinatorEntity, CoverEntity):
-    """Representation of a SmartThings garage door."""
-
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
-    _attr_device_class = CoverDeviceClass.GARAGE
-
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the cover."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_garage_door"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Garage Door"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the cover."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Garage Door"))
-
-    @property
-    def supported_features(self) -> CoverEntityFeature:
-        """Flag supported features."""
-        return CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
-
-    @property
-    def is_closed(self) -> Optional[bool]:
-        """Return if the cover is closed."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "garageDoorControl" in component_status:
-                door = (
-                    component_status["garageDoorControl"].get("door", {}).get("value")
-                )
-                return door == "closed"
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    async def async_open_cover(self, **kwargs: Any) -> None:
-        """Open the cover."""
-        try:
-            await self._api.send_device_command(
-                self._device_id,
-                "garageDoorControl",
-                "open",
-            )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to open garage door %s: %s", self._device_id, err)
-
-    async def async_close_cover(self, **kwargs: Any) -> None:
-        """Close the cover."""
-        try:
-            await self._api.send_device_command(
-                self._device_id,
-                "garageDoorControl",
-                "close",
-            )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to close garage door %s: %s", self._device_id, err)
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:garage"
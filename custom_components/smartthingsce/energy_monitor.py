@@ -17,15 +17,24 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DOMAIN,
+    get_capability_status,
+    get_device_info,
+    get_device_name,
+    get_status_value,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Energy meter attributes exposed under their own names
+ENERGY_ATTRIBUTES = {"energy": "energy_wh", "deltaEnergy": "delta_energy_wh"}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -36,364 +45,177 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     api = hass.data[DOMAIN][config_entry.entry_id]["api"]
 
+    # One sensor for each energy monitoring capability a device has.
+    # ENERGY_SENSOR_CLASSES is defined after the sensor classes below
     entities = []
-    for device_id, device in coordinator.devices.items():
-        capability_ids = get_device_capabilities(device)
-
-        # Check for energy monitoring capabilities
-        has_energy_capabilities = any(
-            cap in capability_ids
-            for cap in [
-                "energyMeter",
-                "powerMeter",
-                "voltageMeasurement",
-                "currentMeasurement",
-            ]
-        )
-
-        if has_energy_capabilities:
-            device_label = device.get("label", device_id)
-
-            # Energy Meter (cumulative energy consumption)
-            if "energyMeter" in capability_ids:
-                _LOGGER.info("Creating energy meter sensor for device %s", device_label)
-                entities.append(SmartThingsEnergyMeter(coordinator, api, device_id))
-
-            # Power Meter (instantaneous power consumption)
-            if "powerMeter" in capability_ids:
-                _LOGGER.info("Creating power meter sensor for device %s", device_label)
-                entities.append(SmartThingsPowerMeter(coordinator, api, device_id))
-
-            # Voltage Measurement
-            if "voltageMeasurement" in capability_ids:
-                _LOGGER.info("Creating voltage sensor for device %s", device_label)
-                entities.append(SmartThingsVoltageSensor(coordinator, api, device_id))
-
-            # Current Measurement
-            if "currentMeasurement" in capability_ids:
-                _LOGGER.info("Creating current sensor for device %s", device_label)
-                entities.append(SmartThingsCurrentSensor(coordinator, api, device_id))
+    for cap_key, sensor_class in ENERGY_SENSOR_CLASSES:
+        for device_id in coordinator.capability_index.get(cap_key, ()):
+            _LOGGER.info(
+                "Creating %s sensor for device %s",
+                cap_key,
+                get_device_name(coordinator.devices[device_id], device_id),
+            )
+            entities.append(sensor_class(coordinator, api, device_id))
 
     async_add_entities(entities)
 
 
-class SmartThingsEnergyMeter(CoordinatorEntity, SensorEntity):
-    """Representation of a SmartThings Energy Meter sensor."""
+class SmartThingsEnergySensor(CoordinatorEntity, SensorEntity):
+    """Base class for SmartThings energy monitoring sensors."""
 
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unique_id_suffix: str
+    # Capability and attribute holding the value, and the divisor to apply
+    _capability: str
+    _attribute: str
+    _divisor = 1.0
 
     def __init__(self, coordinator, api, device_id: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._api = api
         self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_energy_meter"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Energy Monitor"),
-            sw_version=DEVICE_VERSION,
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{self._unique_id_suffix}"
+        self._update_cache()
+        self._attr_device_info = get_device_info(
+            device_id, self._device, "Energy Monitor"
         )
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Energy"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cache()
+        super()._handle_coordinator_update()
+
+    def _update_cache(self) -> None:
+        """Compute the state from the device status once per update."""
+        self._device = self.coordinator.devices.get(self._device_id) or {}
+        self._status = self._device.get("status")
+        self._attr_native_value = self._compute_native_value()
+        self._attr_extra_state_attributes = self._compute_extra_state_attributes()
+
+    def _compute_native_value(self) -> Optional[float]:
+        """Compute the native value of the sensor."""
+        value = get_status_value(self._status or {}, self._capability, self._attribute)
+        if value is not None:
+            try:
+                return float(value) / self._divisor
+            except (ValueError, TypeError):
+                pass
 
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "energyMeter" in component_status:
-                energy = component_status["energyMeter"].get("energy", {}).get("value")
-                if energy is not None:
-                    try:
-                        # SmartThings typically reports in Wh, convert to kWh
-                        return float(energy) / 1000.0
-                    except (ValueError, TypeError):
-                        pass
+        return None
 
+    def _compute_extra_state_attributes(self) -> Optional[dict[str, Any]]:
+        """Compute additional state attributes."""
         return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-        attributes = {}
-
-        for component_id, component_status in status.items():
-            if "energyMeter" in component_status:
-                energy_data = component_status["energyMeter"]
-
-                # Add raw energy value in Wh
-                if "energy" in energy_data:
-                    raw_energy = energy_data["energy"].get("value")
-                    if raw_energy is not None:
-                        attributes["energy_wh"] = raw_energy
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._status is not None
 
-                # Add energy meter delta if available
-                if "deltaEnergy" in energy_data:
-                    delta = energy_data["deltaEnergy"].get("value")
-                    if delta is not None:
-                        attributes["delta_energy_wh"] = delta
 
-                # Add any additional energy properties
-                for key, value_dict in energy_data.items():
-                    if key not in ["energy", "deltaEnergy"] and isinstance(
-                        value_dict, dict
-                    ):
-                        if "value" in value_dict:
-                            attributes[f"energy_{key}"] = value_dict["value"]
+class SmartThingsEnergyMeter(SmartThingsEnergySensor):
+    """Representation of a SmartThings Energy Meter sensor."""
 
-                break
+    _attr_name = "Energy"
+    _attr_icon = "mdi:lightning-bolt"
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _unique_id_suffix = "energy_meter"
+    _capability = "energyMeter"
+    _attribute = "energy"
+    # SmartThings typically reports in Wh, convert to kWh
+    _divisor = 1000.0
+
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
+        """Compute additional state attributes."""
+        energy_data = get_capability_status(self._status or {}, "energyMeter")
+        attributes = {}
+        if energy_data is None:
+            return attributes
+
+        for key, value_dict in energy_data.items():
+            if not isinstance(value_dict, dict):
+                continue
+            if key in ENERGY_ATTRIBUTES:
+                # Raw energy and energy delta in Wh, when reported
+                value = value_dict.get("value")
+                if value is not None:
+                    attributes[ENERGY_ATTRIBUTES[key]] = value
+            elif "value" in value_dict:
+                # Any additional energy properties
+                attributes[f"energy_{key}"] = value_dict["value"]
 
         return attributes
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:lightning-bolt"
-
-
-class SmartThingsPowerMeter(CoordinatorEntity, SensorEntity):
+class SmartThingsPowerMeter(SmartThingsEnergySensor):
     """Representation of a SmartThings Power Meter sensor."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
+    _attr_name = "Power"
+    _attr_icon = "mdi:flash"
     _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _unique_id_suffix = "power_meter"
+    _capability = "powerMeter"
+    _attribute = "power"
 
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_power_meter"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Energy Monitor"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Power"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "powerMeter" in component_status:
-                power = component_status["powerMeter"].get("power", {}).get("value")
-                if power is not None:
-                    try:
-                        return float(power)
-                    except (ValueError, TypeError):
-                        pass
-
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
+        """Compute additional state attributes."""
+        power_data = get_capability_status(self._status or {}, "powerMeter")
         attributes = {}
+        if power_data is None:
+            return attributes
 
-        for component_id, component_status in status.items():
-            if "powerMeter" in component_status:
-                power_data = component_status["powerMeter"]
-
+        for key, value_dict in power_data.items():
+            if key == "power" or not isinstance(value_dict, dict):
+                continue
+            if key == "powerConsumptionReport":
                 # Add power consumption tier info if available
-                if "powerConsumptionReport" in power_data:
-                    report = power_data["powerConsumptionReport"].get("value", {})
-                    if isinstance(report, dict):
-                        for key, value in report.items():
-                            attributes[f"power_{key}"] = value
-
-                # Add any additional power properties
-                for key, value_dict in power_data.items():
-                    if key not in ["power", "powerConsumptionReport"] and isinstance(
-                        value_dict, dict
-                    ):
-                        if "value" in value_dict:
-                            attributes[f"power_{key}"] = value_dict["value"]
-
-                break
+                report = value_dict.get("value", {})
+                if isinstance(report, dict):
+                    for report_key, value in report.items():
+                        attributes[f"power_{report_key}"] = value
+            elif "value" in value_dict:
+                # Any additional power properties
+                attributes[f"power_{key}"] = value_dict["value"]
 
         return attributes
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:flash"
 
-
-class SmartThingsVoltageSensor(CoordinatorEntity, SensorEntity):
+class SmartThingsVoltageSensor(SmartThingsEnergySensor):
     """Representation of a SmartThings Voltage sensor."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
+    _attr_name = "Voltage"
+    _attr_icon = "mdi:sine-wave"
     _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_voltage"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Energy Monitor"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Voltage"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "voltageMeasurement" in component_status:
-                voltage = (
-                    component_status["voltageMeasurement"]
-                    .get("voltage", {})
-                    .get("value")
-                )
-                if voltage is not None:
-                    try:
-                        return float(voltage)
-                    except (ValueError, TypeError):
-                        pass
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:sine-wave"
+    _unique_id_suffix = "voltage"
+    _capability = "voltageMeasurement"
+    _attribute = "voltage"
 
 
-class SmartThingsCurrentSensor(CoordinatorEntity, SensorEntity):
+class SmartThingsCurrentSensor(SmartThingsEnergySensor):
     """Representation of a SmartThings Current sensor."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
+    _attr_name = "Current"
+    _attr_icon = "mdi:current-ac"
     _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_current"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Energy Monitor"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Current"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the native value of the sensor."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "currentMeasurement" in component_status:
-                current = (
-                    component_status["currentMeasurement"]
-                    .get("current", {})
-                    .get("value")
-                )
-                if current is not None:
-                    try:
-                        return float(current)
-                    except (ValueError, TypeError):
-                        pass
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:current-ac"
+    _unique_id_suffix = "current"
+    _capability = "currentMeasurement"
+    _attribute = "current"
+
+
+# Energy monitoring capabilities with their sensor classes. Kept right after
+# the classes it names and read by async_setup_entry above
+ENERGY_SENSOR_CLASSES = (
+    ("energyMeter", SmartThingsEnergyMeter),
+    ("powerMeter", SmartThingsPowerMeter),
+    ("voltageMeasurement", SmartThingsVoltageSensor),
+    ("currentMeasurement", SmartThingsCurrentSensor),
+)
@@ -3,30 +3,41 @@
 from __future__ import annotations
 
 import logging
-import math
 from typing import Any, Optional
 
-from homeassistant.components.fan import (
-    FanEntity,
-    FanEntityFeature,
-)
+from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util.percentage import (
-    ordered_list_item_to_percentage,
-    percentage_to_ordered_list_item,
+from homeassistant.util.percentage import ordered_list_item_to_percentage
+
+from .const import (
+    ATTRIBUTION,
+    DOMAIN,
+    get_capability_status,
+    get_device_info,
+    get_device_name,
+    get_status_value,
 )
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
-
 _LOGGER = logging.getLogger(__name__)
 
 # SmartThings fan speed values (ordered from low to high)
 SMARTTHINGS_FAN_SPEEDS = ["low", "medium", "high"]
 
+# fanSpeed values that mean the fan is off
+FAN_OFF_VALUES = frozenset({"off", 0, None})
+
+# Percentage for each named fan speed
+FAN_SPEED_PERCENTAGES = {
+    speed: ordered_list_item_to_percentage(SMARTTHINGS_FAN_SPEEDS, speed)
+    for speed in SMARTTHINGS_FAN_SPEEDS
+}
+
+# Device type name fragments of switch-only devices that are fans
+FAN_DEVICE_TYPES = ("fan", "ventilator", "exhaust")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -38,62 +49,94 @@ async def async_setup_entry(
     api = hass.data[DOMAIN][config_entry.entry_id]["api"]
 
     entities = []
-    for device_id, device in coordinator.devices.items():
-        capability_ids = get_device_capabilities(device)
-
-        # Check for fan capabilities
-        if "fanSpeed" in capability_ids:
+    fan_speed_ids = coordinator.capability_index.get("fanSpeed", [])
+    for device_id in fan_speed_ids:
+        _LOGGER.info(
+            "Creating fan speed control for device %s",
+            get_device_name(coordinator.devices[device_id], device_id),
+        )
+        entities.append(SmartThingsFanSpeedControl(coordinator, api, device_id))
+
+    fan_speed_ids = set(fan_speed_ids)
+    for device_id in coordinator.capability_index.get("switch", ()):
+        if device_id in fan_speed_ids:
+            continue
+        # Check if this is actually a fan device by checking device type
+        device = coordinator.devices[device_id]
+        device_type = device.get("deviceTypeName", "").lower()
+        if any(fan_type in device_type for fan_type in FAN_DEVICE_TYPES):
             _LOGGER.info(
-                "Creating fan speed control for device %s",
-                device.get("label", device_id),
+                "Creating simple fan switch for device %s",
+                get_device_name(device, device_id),
             )
-            entities.append(SmartThingsFanSpeedControl(coordinator, api, device_id))
-        elif "switch" in capability_ids:
-            # Check if this is actually a fan device by checking device type
-            device_type = device.get("deviceTypeName", "").lower()
-            if any(
-                fan_type in device_type for fan_type in ["fan", "ventilator", "exhaust"]
-            ):
-                _LOGGER.info(
-                    "Creating simple fan switch for device %s",
-                    device.get("label", device_id),
-                )
-                entities.append(SmartThingsFanSwitch(coordinator, api, device_id))
+            entities.append(SmartThingsFanSwitch(coordinator, api, device_id))
 
     async_add_entities(entities)
 
 
-class SmartThingsFanSpeedControl(CoordinatorEntity, FanEntity):
-    """Representation of a SmartThings fan with speed control."""
+def _is_fan_off(fan_speed: Any) -> bool:
+    """Return whether a reported fanSpeed value means the fan is off."""
+    # Lists and dicts cannot be looked up in the frozenset and never mean off
+    return fan_speed is None or (
+        isinstance(fan_speed, (str, int, float)) and fan_speed in FAN_OFF_VALUES
+    )
+
+
+def _numeric_speed_to_percentage(fan_speed: float) -> int:
+    """Convert a 0-5 or 0-100 fan speed to a percentage."""
+    # If it's in 0-5 range, convert to percentage
+    if fan_speed <= 5:
+        return int(fan_speed * 20) if fan_speed > 0 else 0
+    # If it's already in 0-100 range
+    return min(int(fan_speed), 100)
+
+
+class SmartThingsFanEntity(CoordinatorEntity, FanEntity):
+    """Base class for SmartThings fans."""
 
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
-    _attr_speed_count = len(SMARTTHINGS_FAN_SPEEDS)
+    _attr_icon = "mdi:fan"
+    _unique_id_suffix: str
 
     def __init__(self, coordinator, api, device_id: str) -> None:
         """Initialize the fan."""
         super().__init__(coordinator)
         self._api = api
         self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_fan_speed"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{self._unique_id_suffix}"
+        self._update_cache()
+        self._attr_device_info = get_device_info(device_id, self._device, "Fan")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cache()
+        super()._handle_coordinator_update()
+
+    def _update_cache(self) -> None:
+        """Keep the device, its status and its name."""
+        self._device = self.coordinator.devices.get(self._device_id) or {}
+        self._status = self._device.get("status")
+        self._attr_name = get_device_name(self._device, "Fan")
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Fan"),
-            sw_version=DEVICE_VERSION,
-        )
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._status is not None
 
-    @property
-    def name(self) -> str:
-        """Return the name of the fan."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Fan"))
+
+class SmartThingsFanSpeedControl(SmartThingsFanEntity):
+    """Representation of a SmartThings fan with speed control."""
+
+    _attr_speed_count = len(SMARTTHINGS_FAN_SPEEDS)
+    _unique_id_suffix = "fan_speed"
+
+    def _update_cache(self) -> None:
+        """Compute the state from the device status once per update."""
+        super()._update_cache()
+        self._is_on = self._compute_is_on()
+        self._attr_percentage = self._compute_percentage()
 
     @property
     def supported_features(self) -> FanEntityFeature:
@@ -103,76 +146,44 @@ class SmartThingsFanSpeedControl(CoordinatorEntity, FanEntity):
     @property
     def is_on(self) -> Optional[bool]:
         """Return true if the fan is on."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
+        return self._is_on
+
+    def _compute_is_on(self) -> bool:
+        """Compute whether the fan is on."""
+        status = self._status or {}
 
         # Check fanSpeed capability first
-        for component_id, component_status in status.items():
-            if "fanSpeed" in component_status:
-                fan_speed = (
-                    component_status["fanSpeed"].get("fanSpeed", {}).get("value")
-                )
-                return fan_speed is not None and fan_speed != "off" and fan_speed != 0
+        fan_status = get_capability_status(status, "fanSpeed")
+        if fan_status is not None:
+            fan_speed = fan_status.get("fanSpeed", {}).get("value")
+            return not _is_fan_off(fan_speed)
 
         # Fall back to switch capability if present
-        for component_id, component_status in status.items():
-            if "switch" in component_status:
-                switch_state = component_status["switch"].get("switch", {}).get("value")
-                return switch_state == "on"
+        return get_status_value(status, "switch", "switch") == "on"
 
-        return False
+    def _compute_percentage(self) -> int:
+        """Compute the current speed percentage."""
+        fan_speed = get_status_value(self._status or {}, "fanSpeed", "fanSpeed")
 
-    @property
-    def percentage(self) -> Optional[int]:
-        """Return the current speed percentage."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {})
-
-        for component_id, component_status in status.items():
-            if "fanSpeed" in component_status:
-                fan_speed = (
-                    component_status["fanSpeed"].get("fanSpeed", {}).get("value")
-                )
-
-                if fan_speed is None or fan_speed == "off":
-                    return 0
-
-                # Handle numeric values (0-100 or 0-5 range)
-                if isinstance(fan_speed, (int, float)):
-                    # If it's in 0-5 range, convert to percentage
-                    if fan_speed <= 5:
-                        return int(fan_speed * 20) if fan_speed > 0 else 0
-                    # If it's already in 0-100 range
-                    elif fan_speed <= 100:
-                        return int(fan_speed)
-                    else:
-                        return 100
-
-                # Handle string values
-                if isinstance(fan_speed, str):
-                    try:
-                        # Try to convert string to int first
-                        numeric_speed = int(fan_speed)
-                        if numeric_speed <= 5:
-                            return int(numeric_speed * 20) if numeric_speed > 0 else 0
-                        elif numeric_speed <= 100:
-                            return int(numeric_speed)
-                        else:
-                            return 100
-                    except ValueError:
-                        # Handle named speeds (low, medium, high)
-                        if fan_speed.lower() in SMARTTHINGS_FAN_SPEEDS:
-                            return ordered_list_item_to_percentage(
-                                SMARTTHINGS_FAN_SPEEDS, fan_speed.lower()
-                            )
+        if _is_fan_off(fan_speed):
+            return 0
 
-        return 0
+        # Handle numeric values (0-100 or 0-5 range)
+        if isinstance(fan_speed, (int, float)):
+            return _numeric_speed_to_percentage(fan_speed)
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        # Handle string values
+        if isinstance(fan_speed, str):
+            # Handle named speeds (low, medium, high)
+            percentage = FAN_SPEED_PERCENTAGES.get(fan_speed.lower())
+            if percentage is not None:
+                return percentage
+            try:
+                return _numeric_speed_to_percentage(int(fan_speed))
+            except ValueError:
+                pass
+
+        return 0
 
     async def async_turn_on(
         self,
@@ -181,18 +192,20 @@ class SmartThingsFanSpeedControl(CoordinatorEntity, FanEntity):
         **kwargs: Any,
     ) -> None:
         """Turn on the fan."""
+        if percentage is not None:
+            # Setting the speed refreshes on its own
+            await self.async_set_percentage(percentage)
+            return
+
         try:
-            if percentage is not None:
-                await self.async_set_percentage(percentage)
-            else:
-                # Turn on at medium speed if no percentage specified
-                await self._api.send_device_command(
-                    self._device_id,
-                    "fanSpeed",
-                    "setFanSpeed",
-                    [2],  # Medium speed (assuming 0-4 scale)
-                )
-            await self.coordinator.async_request_refresh()
+            # Turn on at medium speed if no percentage specified
+            await self._api.send_device_command(
+                self._device_id,
+                "fanSpeed",
+                "setFanSpeed",
+                [2],  # Medium speed (assuming 0-4 scale)
+            )
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
             _LOGGER.error("Failed to turn on fan %s: %s", self._device_id, err)
 
@@ -205,7 +218,7 @@ class SmartThingsFanSpeedControl(CoordinatorEntity, FanEntity):
                 "setFanSpeed",
                 [0],  # Off
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
             _LOGGER.error("Failed to turn off fan %s: %s", self._device_id, err)
 
@@ -215,9 +228,8 @@ class SmartThingsFanSpeedControl(CoordinatorEntity, FanEntity):
             if percentage == 0:
                 fan_speed = 0
             else:
-                # Convert percentage to 1-4 scale (0 is off)
-                fan_speed = math.ceil(percentage / 25)
-                fan_speed = max(1, min(4, fan_speed))
+                # Convert percentage to 1-4 scale (0 is off), rounding up
+                fan_speed = max(1, min(4, (percentage + 24) // 25))
 
             await self._api.send_device_command(
                 self._device_id,
@@ -225,46 +237,15 @@ class SmartThingsFanSpeedControl(CoordinatorEntity, FanEntity):
                 "setFanSpeed",
                 [fan_speed],
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
             _LOGGER.error("Failed to set fan speed %s: %s", self._device_id, err)
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:fan"
-
 
-class SmartThingsFanSwitch(CoordinatorEntity, FanEntity):
+class SmartThingsFanSwitch(SmartThingsFanEntity):
     """Representation of a simple SmartThings fan with only on/off control."""
 
-    _attr_has_entity_name = True
-    _attr_attribution = ATTRIBUTION
-
-    def __init__(self, coordinator, api, device_id: str) -> None:
-        """Initialize the fan."""
-        super().__init__(coordinator)
-        self._api = api
-        self._device_id = device_id
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_fan_switch"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
-            manufacturer=device.get("manufacturerName", "SmartThings"),
-            model=device.get("deviceTypeName", "Fan"),
-            sw_version=DEVICE_VERSION,
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the fan."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Fan"))
+    _unique_id_suffix = "fan_switch"
 
     @property
     def supported_features(self) -> FanEntityFeature:
@@ -274,16 +255,10 @@ class SmartThingsFanSwitch(CoordinatorEntity, FanEntity):
     @property
     def is_on(self) -> Optional[bool]:
         """Return true if the fan is on."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        status = device.get("status", {}).get("main", {}).get("switch", {})
-        switch_state = status.get("switch", {}).get("value")
-        return switch_state == "on"
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        # Unknown until the device has reported a status
+        if self._status is None:
+            return None
+        return get_status_value(self._status, "switch", "switch") == "on"
 
     async def async_turn_on(
         self,
@@ -298,7 +273,7 @@ class SmartThingsFanSwitch(CoordinatorEntity, FanEntity):
                 "switch",
                 "on",
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
             _LOGGER.error("Failed to turn on fan %s: %s", self._device_id, err)
 
@@ -310,11 +285,6 @@ class SmartThingsFanSwitch(CoordinatorEntity, FanEntity):
                 "switch",
                 "off",
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_after_command()
         except Exception as err:
             _LOGGER.error("Failed to turn off fan %s: %s", self._device_id, err)
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:fan"
@@ -15,15 +15,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util.color import (
-    color_hs_to_RGB,
-    color_RGB_to_hs,
-    color_temperature_kelvin_to_mired,
-    color_temperature_mired_to_kelvin,
+from homeassistant.util.color import color_temperature_kelvin_to_mired
+
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
 )
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -94,7 +95,7 @@ class SmartThingsLight(CoordinatorEntity, LightEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Light"),
             sw_version=DEVICE_VERSION,
@@ -104,7 +105,7 @@ class SmartThingsLight(CoordinatorEntity, LightEntity):
     def name(self) -> str:
         """Return the name of the light."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Light"))
+        return get_device_name(device, "Light")
 
     @property
     def is_on(self) -> Optional[bool]:
@@ -154,8 +155,8 @@ class SmartThingsLight(CoordinatorEntity, LightEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
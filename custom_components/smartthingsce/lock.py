@@ -10,7 +10,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -59,7 +59,7 @@ class SmartThingsLock(CoordinatorEntity, LockEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Lock"),
             sw_version=DEVICE_VERSION,
@@ -69,7 +69,7 @@ class SmartThingsLock(CoordinatorEntity, LockEntity):
     def name(self) -> str:
         """Return the name of the lock."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Lock"))
+        return get_device_name(device, "Lock")
 
     @property
     def is_locked(self) -> Optional[bool]:
@@ -82,8 +82,8 @@ class SmartThingsLock(CoordinatorEntity, LockEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the lock."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Optional
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -17,7 +17,13 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,7 +47,8 @@ async def async_setup_entry(
             for cap in ["mediaPlayback", "audioVolume", "tvChannel", "mediaInputSource"]
         ):
             _LOGGER.info(
-                "Creating media player for device %s", device.get("label", device_id)
+                "Creating media player for device %s",
+                get_device_name(device, device_id),
             )
             entities.append(SmartThingsMediaPlayer(coordinator, api, device_id))
 
@@ -67,7 +74,7 @@ class SmartThingsMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Media Player"),
             sw_version=DEVICE_VERSION,
@@ -77,7 +84,7 @@ class SmartThingsMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     def name(self) -> str:
         """Return the name of the media player."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Media Player"))
+        return get_device_name(device, "Media Player")
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
@@ -221,8 +228,8 @@ class SmartThingsMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
@@ -12,13 +12,19 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfMass, UnitOfVolume
+from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,7 +44,7 @@ async def async_setup_entry(
 
         # Pet Feeder devices
         if "petFeederOperatingState" in capability_ids:
-            device_label = device.get("label", device_id)
+            device_label = get_device_name(device, device_id)
 
             # Operating state sensor
             _LOGGER.info(
@@ -98,7 +104,7 @@ class SmartThingsPetFeederOperatingState(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pet Feeder"),
             sw_version=DEVICE_VERSION,
@@ -134,8 +140,8 @@ class SmartThingsPetFeederOperatingState(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -173,7 +179,7 @@ class SmartThingsPetFeederFoodLevel(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pet Feeder"),
             sw_version=DEVICE_VERSION,
@@ -208,8 +214,8 @@ class SmartThingsPetFeederFoodLevel(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -244,7 +250,7 @@ class SmartThingsPetFeederSchedule(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pet Feeder"),
             sw_version=DEVICE_VERSION,
@@ -302,8 +308,8 @@ class SmartThingsPetFeederSchedule(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -330,7 +336,7 @@ class SmartThingsPetFeederFeedControl(CoordinatorEntity, SwitchEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pet Feeder"),
             sw_version=DEVICE_VERSION,
@@ -361,8 +367,8 @@ class SmartThingsPetFeederFeedControl(CoordinatorEntity, SwitchEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start feeding."""
@@ -11,17 +11,19 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    PERCENTAGE,
-    UnitOfIlluminance,
-    UnitOfTemperature,
-)
+from homeassistant.const import PERCENTAGE, UnitOfIlluminance, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,7 +57,7 @@ async def async_setup_entry(
             is_plant_monitor = True
 
         if is_plant_monitor:
-            device_label = device.get("label", device_id)
+            device_label = get_device_name(device, device_id)
 
             # Soil Moisture sensor
             if "soilMoisture" in capability_ids:
@@ -122,7 +124,7 @@ class SmartThingsSoilMoisture(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Plant Monitor"),
             sw_version=DEVICE_VERSION,
@@ -157,8 +159,8 @@ class SmartThingsSoilMoisture(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -196,7 +198,7 @@ class SmartThingsPlantMoisture(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Plant Monitor"),
             sw_version=DEVICE_VERSION,
@@ -231,8 +233,8 @@ class SmartThingsPlantMoisture(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -260,7 +262,7 @@ class SmartThingsPlantHealth(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Plant Monitor"),
             sw_version=DEVICE_VERSION,
@@ -294,8 +296,8 @@ class SmartThingsPlantHealth(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -334,7 +336,7 @@ class SmartThingsPlantNutrient(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Plant Monitor"),
             sw_version=DEVICE_VERSION,
@@ -390,8 +392,8 @@ class SmartThingsPlantNutrient(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -421,7 +423,7 @@ class SmartThingsPlantTemperature(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Plant Monitor"),
             sw_version=DEVICE_VERSION,
@@ -456,8 +458,8 @@ class SmartThingsPlantTemperature(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -487,7 +489,7 @@ class SmartThingsPlantLight(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Plant Monitor"),
             sw_version=DEVICE_VERSION,
@@ -522,8 +524,8 @@ class SmartThingsPlantLight(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -28,7 +28,13 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,7 +74,7 @@ async def async_setup_entry(
             is_pool_device = True
 
         if is_pool_device:
-            device_label = device.get("label", device_id)
+            device_label = get_device_name(device, device_id)
 
             # Pool Controller (main status)
             if "poolController" in capability_ids:
@@ -139,7 +145,7 @@ class SmartThingsPoolControllerStatus(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pool Controller"),
             sw_version=DEVICE_VERSION,
@@ -175,8 +181,8 @@ class SmartThingsPoolControllerStatus(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -219,7 +225,7 @@ class SmartThingsPoolHeaterThermostat(CoordinatorEntity, ClimateEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pool Heater"),
             sw_version=DEVICE_VERSION,
@@ -325,8 +331,8 @@ class SmartThingsPoolHeaterThermostat(CoordinatorEntity, ClimateEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -393,7 +399,7 @@ class SmartThingsPoolPumpControl(CoordinatorEntity, SwitchEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pool Pump"),
             sw_version=DEVICE_VERSION,
@@ -425,8 +431,8 @@ class SmartThingsPoolPumpControl(CoordinatorEntity, SwitchEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the pump on."""
@@ -479,7 +485,7 @@ class SmartThingsPoolPumpSpeed(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pool Pump"),
             sw_version=DEVICE_VERSION,
@@ -510,8 +516,8 @@ class SmartThingsPoolPumpSpeed(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -541,7 +547,7 @@ class SmartThingsPoolTemperature(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pool Sensor"),
             sw_version=DEVICE_VERSION,
@@ -576,8 +582,8 @@ class SmartThingsPoolTemperature(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -606,7 +612,7 @@ class SmartThingsPoolChlorine(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pool Chemical Monitor"),
             sw_version=DEVICE_VERSION,
@@ -641,8 +647,8 @@ class SmartThingsPoolChlorine(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -678,7 +684,7 @@ class SmartThingsPoolPH(CoordinatorEntity, SensorEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Pool Chemical Monitor"),
             sw_version=DEVICE_VERSION,
@@ -709,8 +715,8 @@ class SmartThingsPoolPH(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     @property
     def icon(self) -> str:
@@ -22,7 +22,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -216,23 +216,12 @@ async def async_setup_entry(
     """Set up SmartThings sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    entities = []
-
-    for device_id, device in coordinator.devices.items():
-        # Get capabilities from the main component
-        capability_ids = get_device_capabilities(device)
-
-        # Create sensor for each supported capability
-        for cap_id in capability_ids:
-            if cap_id in SENSOR_TYPES:
-                entities.append(
-                    SmartThingsSensor(
-                        coordinator,
-                        device_id,
-                        cap_id,
-                        SENSOR_TYPES[cap_id],
-                    )
-                )
+    # Create sensor for each supported capability of the main component
+    entities = [
+        SmartThingsSensor(coordinator, device_id, cap_id, sensor_config)
+        for cap_id, sensor_config in SENSOR_TYPES.items()
+        for device_id in coordinator.capability_index.get(cap_id, ())
+    ]
 
     async_add_entities(entities)
 
@@ -272,7 +261,7 @@ class SmartThingsSensor(CoordinatorEntity, SensorEntity):
 
         device_info = {
             "identifiers": {(DOMAIN, self._device_id)},
-            "name": device.get("label", device.get("name", "Unknown")),
+            "name": get_device_name(device),
             "manufacturer": device.get("manufacturerName", "SmartThings"),
             "model": device.get("deviceTypeName", "Sensor"),
             "sw_version": DEVICE_VERSION,
@@ -353,5 +342,5 @@ class SmartThingsSensor(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
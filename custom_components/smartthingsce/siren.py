@@ -5,20 +5,20 @@ from __future__ import annotations
 import logging
 from typing import Any, Optional
 
-from homeassistant.components.siren import (
-    ATTR_DURATION,
-    ATTR_TONE,
-    ATTR_VOLUME_LEVEL,
-    SirenEntity,
-    SirenEntityFeature,
-)
+from homeassistant.components.siren import ATTR_TONE, SirenEntity, SirenEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,17 +39,17 @@ async def async_setup_entry(
         # Check for siren capabilities
         if "alarm" in capability_ids:
             _LOGGER.info(
-                "Creating alarm siren for device %s", device.get("label", device_id)
+                "Creating alarm siren for device %s", get_device_name(device, device_id)
             )
             entities.append(SmartThingsAlarmSiren(coordinator, api, device_id))
         elif "tone" in capability_ids:
             _LOGGER.info(
-                "Creating tone siren for device %s", device.get("label", device_id)
+                "Creating tone siren for device %s", get_device_name(device, device_id)
             )
             entities.append(SmartThingsToneSiren(coordinator, api, device_id))
         elif "chime" in capability_ids:
             _LOGGER.info(
-                "Creating chime siren for device %s", device.get("label", device_id)
+                "Creating chime siren for device %s", get_device_name(device, device_id)
             )
             entities.append(SmartThingsChimeSiren(coordinator, api, device_id))
 
@@ -75,7 +75,7 @@ class SmartThingsAlarmSiren(CoordinatorEntity, SirenEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Alarm"),
             sw_version=DEVICE_VERSION,
@@ -85,7 +85,7 @@ class SmartThingsAlarmSiren(CoordinatorEntity, SirenEntity):
     def name(self) -> str:
         """Return the name of the siren."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Alarm"))
+        return get_device_name(device, "Alarm")
 
     @property
     def supported_features(self) -> SirenEntityFeature:
@@ -108,8 +108,8 @@ class SmartThingsAlarmSiren(CoordinatorEntity, SirenEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the siren on."""
@@ -161,7 +161,7 @@ class SmartThingsToneSiren(CoordinatorEntity, SirenEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Tone"),
             sw_version=DEVICE_VERSION,
@@ -171,7 +171,7 @@ class SmartThingsToneSiren(CoordinatorEntity, SirenEntity):
     def name(self) -> str:
         """Return the name of the siren."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Tone"))
+        return get_device_name(device, "Tone")
 
     @property
     def supported_features(self) -> SirenEntityFeature:
@@ -226,8 +226,8 @@ class SmartThingsToneSiren(CoordinatorEntity, SirenEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the siren on."""
@@ -291,7 +291,7 @@ class SmartThingsChimeSiren(CoordinatorEntity, SirenEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Chime"),
             sw_version=DEVICE_VERSION,
@@ -301,7 +301,7 @@ class SmartThingsChimeSiren(CoordinatorEntity, SirenEntity):
     def name(self) -> str:
         """Return the name of the siren."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Chime"))
+        return get_device_name(device, "Chime")
 
     @property
     def supported_features(self) -> SirenEntityFeature:
@@ -317,8 +317,8 @@ class SmartThingsChimeSiren(CoordinatorEntity, SirenEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the siren on (play chime)."""
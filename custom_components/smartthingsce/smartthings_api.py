@@ -1,17 +1,21 @@
 """SmartThings API client."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 from aiohttp import ClientSession
 
+from homeassistant.util.json import json_loads
+
 from .const import (
     API_BASE_URL,
     API_DEVICES,
     API_LOCATIONS,
     API_ROOMS,
     API_SCENES,
+    MAX_CONCURRENT_REQUESTS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,20 +36,32 @@ class SmartThingsAPI:
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
         }
+        # Last known (ETag, status) per device for conditional status requests
+        self._status_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # The session is shared with the rest of Home Assistant, so bound
+        # our own fan-out rather than relying on its connector limits
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     async def _request(
         self,
         method: str,
         url: str,
         data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        return_etag: bool = False,
     ) -> Any:
-        """Make an API request."""
+        """
+        Make an API request.
+
+        Extra headers are merged into the default ones. With return_etag the
+        result is a (body, etag) tuple; the body is None for 204 and 304.
+        """
         try:
             _LOGGER.debug("Making %s request to %s", method, url)
-            async with self._session.request(
+            async with self._request_semaphore, self._session.request(
                 method,
                 url,
-                headers=self._headers,
+                headers={**self._headers, **headers} if headers else self._headers,
                 json=data,
                 timeout=aiohttp.ClientTimeout(total=30),
             ) as response:
@@ -55,11 +71,14 @@ class SmartThingsAPI:
 
                 response.raise_for_status()
 
-                if response.status == 204:
-                    return None
+                if response.status in (204, 304):
+                    result = None
+                else:
+                    result = await response.json(loads=json_loads)
+                    _LOGGER.debug("Request successful, status: %s", response.status)
 
-                result = await response.json()
-                _LOGGER.debug("Request successful, status: %s", response.status)
+                if return_etag:
+                    return result, response.headers.get("ETag")
                 return result
 
         except aiohttp.ClientResponseError as err:
@@ -112,10 +131,28 @@ class SmartThingsAPI:
         return await self._request("GET", url)
 
     async def get_device_status(self, device_id: str) -> Dict[str, Any]:
-        """Get device status."""
+        """Get device status, reusing the cached status if it is unchanged."""
         url = f"{API_DEVICES}/{device_id}/status"
-        response = await self._request("GET", url)
-        return response.get("components", {})
+        cached = self._status_cache.get(device_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response, etag = await self._request(
+            "GET", url, headers=headers, return_etag=True
+        )
+        if response is None:
+            # 304 Not Modified
+            return cached[1] if cached else {}
+
+        status = response.get("components", {})
+        if etag:
+            self._status_cache[device_id] = (etag, status)
+        else:
+            self._status_cache.pop(device_id, None)
+        return status
+
+    def invalidate_device_status(self, device_id: str) -> None:
+        """Forget the cached status so the next request fetches it in full."""
+        self._status_cache.pop(device_id, None)
 
     async def get_device_health(self, device_id: str) -> Dict[str, Any]:
         """Get device health."""
@@ -10,7 +10,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_AUTHOR, DEVICE_VERSION, DOMAIN
+from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,13 +50,13 @@ async def async_setup_entry(
         ):
             _LOGGER.info(
                 "Creating Power Cool switch for device %s",
-                device.get("label", device_id),
+                get_device_name(device, device_id),
             )
             entities.append(SmartThingsPowerCoolSwitch(coordinator, api, device_id))
         elif "samsungce.powerCool" in capability_ids:
             _LOGGER.debug(
                 "Skipping Power Cool switch for device %s - disabled",
-                device.get("label", device_id),
+                get_device_name(device, device_id),
             )
 
         if (
@@ -65,13 +65,13 @@ async def async_setup_entry(
         ):
             _LOGGER.info(
                 "Creating Power Freeze switch for device %s",
-                device.get("label", device_id),
+                get_device_name(device, device_id),
             )
             entities.append(SmartThingsPowerFreezeSwitch(coordinator, api, device_id))
         elif "samsungce.powerFreeze" in capability_ids:
             _LOGGER.debug(
                 "Skipping Power Freeze switch for device %s - disabled",
-                device.get("label", device_id),
+                get_device_name(device, device_id),
             )
 
     async_add_entities(entities)
@@ -96,7 +96,7 @@ class SmartThingsSwitch(CoordinatorEntity, SwitchEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Switch"),
             sw_version=DEVICE_VERSION,
@@ -106,7 +106,7 @@ class SmartThingsSwitch(CoordinatorEntity, SwitchEntity):
     def name(self) -> str:
         """Return the name of the switch."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Switch"))
+        return get_device_name(device, "Switch")
 
     @property
     def is_on(self) -> Optional[bool]:
@@ -119,8 +119,8 @@ class SmartThingsSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -210,7 +210,7 @@ class SmartThingsPowerCoolSwitch(CoordinatorEntity, SwitchEntity):
 
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=model or device.get("deviceTypeName", "Refrigerator"),
             sw_version=firmware_version or DEVICE_VERSION,
@@ -246,8 +246,8 @@ class SmartThingsPowerCoolSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn power cool on."""
@@ -330,7 +330,7 @@ class SmartThingsPowerFreezeSwitch(CoordinatorEntity, SwitchEntity):
 
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=model or device.get("deviceTypeName", "Refrigerator"),
             sw_version=firmware_version or DEVICE_VERSION,
@@ -366,8 +366,8 @@ class SmartThingsPowerFreezeSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn power freeze on."""
@@ -20,7 +20,13 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,7 +78,7 @@ async def async_setup_entry(
         if "thermostatMode" in capability_ids:
             _LOGGER.info(
                 "Creating traditional thermostat for device %s",
-                device.get("label", device_id),
+                get_device_name(device, device_id),
             )
             entities.append(
                 SmartThingsTraditionalThermostat(coordinator, api, device_id)
@@ -106,7 +112,7 @@ class SmartThingsTraditionalThermostat(CoordinatorEntity, ClimateEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Thermostat"),
             sw_version=DEVICE_VERSION,
@@ -116,7 +122,7 @@ class SmartThingsTraditionalThermostat(CoordinatorEntity, ClimateEntity):
     def name(self) -> str:
         """Return the name of the thermostat."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Thermostat"))
+        return get_device_name(device, "Thermostat")
 
     @property
     def supported_features(self) -> ClimateEntityFeature:
@@ -333,8 +339,8 @@ class SmartThingsTraditionalThermostat(CoordinatorEntity, ClimateEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -19,7 +19,13 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,7 +62,7 @@ async def async_setup_entry(
         if "robotCleanerMovement" in capability_ids:
             _LOGGER.debug(
                 "Setting up robot vacuum for device %s",
-                device.get("label", device_id),
+                get_device_name(device, device_id),
             )
             entities.append(
                 SmartThingsRobotVacuum(coordinator, device_id, config_entry)
@@ -94,7 +100,7 @@ class SmartThingsRobotVacuum(CoordinatorEntity, StateVacuumEntity):
 
         device = coordinator.data.get(device_id, {})
         self._attr_unique_id = f"{DOMAIN}_{device_id}_vacuum"
-        self._attr_name = device.get("label", "Robot Vacuum")
+        self._attr_name = get_device_name(device, "Robot Vacuum")
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -102,7 +108,7 @@ class SmartThingsRobotVacuum(CoordinatorEntity, StateVacuumEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Robot Vacuum"),
             sw_version=DEVICE_VERSION,
@@ -189,8 +195,8 @@ class SmartThingsRobotVacuum(CoordinatorEntity, StateVacuumEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_start(self) -> None:
         """Start or resume the cleaning task."""
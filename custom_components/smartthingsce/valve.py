@@ -16,7 +16,13 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEVICE_VERSION, DOMAIN, get_device_capabilities
+from .const import (
+    ATTRIBUTION,
+    DEVICE_VERSION,
+    DOMAIN,
+    get_device_capabilities,
+    get_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,7 +60,7 @@ async def async_setup_entry(
 
             _LOGGER.info(
                 "Creating valve for device %s with class %s",
-                device.get("label", device_id),
+                get_device_name(device, device_id),
                 valve_class,
             )
             entities.append(SmartThingsValve(coordinator, api, device_id, valve_class))
@@ -84,7 +90,7 @@ class SmartThingsValve(CoordinatorEntity, ValveEntity):
         device = self.coordinator.devices.get(self._device_id, {})
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
-            name=device.get("label", device.get("name", "Unknown")),
+            name=get_device_name(device),
             manufacturer=device.get("manufacturerName", "SmartThings"),
             model=device.get("deviceTypeName", "Valve"),
             sw_version=DEVICE_VERSION,
@@ -94,7 +100,7 @@ class SmartThingsValve(CoordinatorEntity, ValveEntity):
     def name(self) -> str:
         """Return the name of the valve."""
         device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("label", device.get("name", "Valve"))
+        return get_device_name(device, "Valve")
 
     @property
     def supported_features(self) -> ValveEntityFeature:
@@ -186,8 +192,8 @@ class SmartThingsValve(CoordinatorEntity, ValveEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.devices.get(self._device_id, {})
-        return device.get("status") is not None
+        device = self.coordinator.devices.get(self._device_id)
+        return device is not None and device.get("status") is not None
 
     async def async_open_valve(self, **kwargs: Any) -> None:
         """Open the valve."""
@@ -10,7 +10,13 @@ from homeassistant.components.http import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_TUNNEL_SUBDOMAIN, CONF_WEBHOOK_ENABLED, WEBHOOK_PATH
+from .const import (
+    CONF_TUNNEL_SUBDOMAIN,
+    CONF_WEBHOOK_ENABLED,
+    DEVICE_STATUS,
+    WEBHOOK_PATH,
+    index_device_status,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -117,6 +123,11 @@ class WebhookManager:
         self.tunnel_url: Optional[str] = None
         self.subscriptions: list = []
 
+    @property
+    def push_enabled(self) -> bool:
+        """Return True when device events are pushed to us over the tunnel."""
+        return self.tunnel_url is not None and bool(self.subscriptions)
+
     async def async_setup(self) -> None:
         """Set up webhook and tunnel."""
         try:
@@ -250,19 +261,20 @@ class WebhookManager:
                 # Update device status in coordinator
                 if device_id in self.coordinator.devices:
                     device = self.coordinator.devices[device_id]
-                    if "status" not in device:
-                        device["status"] = {}
-                    if component_id not in device["status"]:
-                        device["status"][component_id] = {}
-                    if capability not in device["status"][component_id]:
-                        device["status"][component_id][capability] = {}
-
-                    device["status"][component_id][capability][attribute] = {
+                    if DEVICE_STATUS not in device:
+                        device[DEVICE_STATUS] = {}
+                    if component_id not in device[DEVICE_STATUS]:
+                        device[DEVICE_STATUS][component_id] = {}
+                    if capability not in device[DEVICE_STATUS][component_id]:
+                        device[DEVICE_STATUS][component_id][capability] = {}
+
+                    device[DEVICE_STATUS][component_id][capability][attribute] = {
                         "value": value
                     }
+                    index_device_status(device, device[DEVICE_STATUS])
 
-            # Trigger coordinator update
-            await self.coordinator.async_request_refresh()
+            # Push the patched state to entities without polling the API
+            self.coordinator.async_set_updated_data(self.coordinator.data)
 
         except Exception as err:
             _LOGGER.error("Error handling device event: %s", err)